@@ -0,0 +1,53 @@
+"""
+Shared fixtures for test_mcp_client_architecture.py.
+
+The tests are plain functions run on one session-wide event loop, so no
+asyncio plugin is needed and the Kairos client connects once per run.
+Fixtures skip when the MCP client modules are not importable.
+"""
+
+import asyncio
+
+import pytest
+
+from test_mcp_client_architecture import PHASE_TIMEOUT, connect_client
+
+
+@pytest.fixture(scope="session")
+def session_loop():
+    """One event loop for the run; connections made on it stay usable across tests"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def agent_manifest():
+    """Load the example manifest once; like main(), paths are relative to the project root"""
+    agent_config_buffer = pytest.importorskip("ras.agent_config_buffer")
+    agent_config_buffer.load_agent_manifest("config/example_agent_manifest.json")
+
+
+@pytest.fixture(scope="session")
+def kairos_client(session_loop, agent_manifest):
+    """A Kairos MultiServerMCPClient connected once and shared by the read-only tests"""
+    multi_server_client = pytest.importorskip("mcp_clients.mcp_python_sdk_2025_03_26.multi_server_client")
+    
+    client = multi_server_client.MultiServerMCPClient("Kairos")
+    try:
+        session_loop.run_until_complete(asyncio.wait_for(connect_client("Kairos", client), timeout=PHASE_TIMEOUT))
+        yield client
+    finally:
+        session_loop.run_until_complete(client.cleanup())
+
+
+@pytest.fixture
+def client_manager(session_loop, agent_manifest):
+    """A fresh MCPClientManager, cleaned up after the test"""
+    mcp_client_manager = pytest.importorskip("ras.mcp_client_manager")
+    
+    manager = mcp_client_manager.MCPClientManager()
+    try:
+        yield manager
+    finally:
+        session_loop.run_until_complete(manager.cleanup_all())
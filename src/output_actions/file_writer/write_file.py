@@ -1,12 +1,17 @@
 # Ensure src is in path for sibling imports
+import os
 import sys
 from pathlib import Path
+from typing import Set
 SRC_DIR = Path(__file__).resolve().parent.parent.parent # Go up three levels: discord -> output_actions -> src
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 from ras.agent_config_buffer import get_output_action_secrets, get_output_action_config
 
+# Output directories already created by this process; skips makedirs' stats on repeat writes.
+_KNOWN_DIRS: Set[str] = set()
+
 def write_response_to_file(output_file_path: str, chat_model_response: str) -> None:
     """
     Writes the chat model response to a file, ensuring the output directory exists.
@@ -14,11 +19,27 @@ def write_response_to_file(output_file_path: str, chat_model_response: str) -> N
     :param output_file_path: Full path to the output file.
     :param chat_model_response: The response text to write to the file.
     """
-    path = Path(output_file_path)
-    path.parent.mkdir(parents=True, exist_ok=True)  # Ensure the directory exists
+    directory = os.path.dirname(output_file_path)
+    if directory not in _KNOWN_DIRS:
+        os.makedirs(directory or ".", exist_ok=True)  # Ensure the directory exists
+        _KNOWN_DIRS.add(directory)
 
-    with path.open('w', encoding='utf-8') as file:
-        file.write(chat_model_response + "\n")
+    # Encode once and write through the raw fd, bypassing the text IO layers.
+    data = memoryview((chat_model_response + "\n").encode("utf-8"))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(output_file_path, flags, 0o666)
+    except FileNotFoundError:
+        # The directory was removed since we created it; recreate it once.
+        _KNOWN_DIRS.discard(directory)
+        os.makedirs(directory or ".", exist_ok=True)
+        _KNOWN_DIRS.add(directory)
+        fd = os.open(output_file_path, flags, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 def process_output_action(agent_name: str, chat_model_response: str, meta_data: dict) -> None:
     output_action_config = get_output_action_config(agent_name)
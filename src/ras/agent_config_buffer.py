@@ -9,8 +9,9 @@ All files are loaded as raw strings, and helper accessors are available to parse
 import os
 import json
 import logging
+import functools
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -31,6 +32,10 @@ global_output_action_secrets = {}
 
 global_input_augmentation_config = {}
 
+# Per-agent counter bumped whenever the agent's MCP commands config or secrets
+# are set, so caches built from them can validate with one dict lookup.
+global_tools_and_data_mcp_commands_fingerprint: Dict[str, int] = {}
+
 # Input Augmentation
 def set_input_augmentation_config(agent_name: str, input_augmentation_config: Dict[str, Any]) -> None:
     json_string = json.dumps(input_augmentation_config)
@@ -110,6 +115,7 @@ def set_tools_and_data_mcp_commands_config(agent_name: str, tools_and_data_mcp_c
     """
     json_string = json.dumps(tools_and_data_mcp_commands_config)
     global_tools_and_data_mcp_commands_config[agent_name] = json_string
+    _bump_config_fingerprint(agent_name)
 
 
 def get_tools_and_data_mcp_commands_config(agent_name: str) -> Dict[str, Any]:
@@ -129,6 +135,63 @@ def get_tools_and_data_mcp_commands_config(agent_name: str) -> Dict[str, Any]:
         logger.warning(f"No MCP commands config found for agent: {agent_name}")
         return {}
 
+def get_tools_and_data_mcp_commands_config_json(agent_name: str) -> Optional[str]:
+    """
+    Retrieve the stored (unparsed) MCP commands configuration
+    
+    Args:
+        agent_name: Name of the agent
+        
+    Returns:
+        The JSON string as stored by the setter, or None if not configured.
+        Use config_fingerprint() to detect configuration changes.
+    """
+    return global_tools_and_data_mcp_commands_config.get(agent_name)
+
+def get_agent_servers(agent_name: str) -> List[str]:
+    """
+    Retrieve the MCP server modules an agent's commands are served by
+    
+    Args:
+        agent_name: Name of the agent
+        
+    Returns:
+        Distinct 'python_code_module' values from the MCP commands config, in
+        config order (empty if the agent has no MCP commands config).
+    """
+    if agent_name not in global_tools_and_data_mcp_commands_config:
+        return []
+    return list(_servers_from_config(agent_name, config_fingerprint(agent_name)))
+
+@functools.lru_cache(maxsize=64)
+def _servers_from_config(agent_name: str, fingerprint: int) -> tuple:
+    """
+    Parse the agent's stored commands config and collect its distinct server modules.
+
+    Keyed on (agent_name, config_fingerprint), like _merge_module_secrets, so a
+    reload is picked up without explicit invalidation and a hit never touches
+    the JSON string.
+    """
+    json_string = global_tools_and_data_mcp_commands_config[agent_name]
+    modules = (cmd.get("python_code_module") for cmd in json.loads(json_string).get("mcp_commands", []))
+    return tuple(dict.fromkeys(module for module in modules if module))
+
+def _bump_config_fingerprint(agent_name: str) -> None:
+    global_tools_and_data_mcp_commands_fingerprint[agent_name] = config_fingerprint(agent_name) + 1
+
+def config_fingerprint(agent_name: str) -> int:
+    """
+    Version of the agent's MCP commands config and secrets
+    
+    Args:
+        agent_name: Name of the agent
+        
+    Returns:
+        A counter that changes whenever either is set (0 if never set).
+        Caches derived from them can store it and rebuild when it differs.
+    """
+    return global_tools_and_data_mcp_commands_fingerprint.get(agent_name, 0)
+
 ## MCP Secrets
 def set_tools_and_data_mcp_commands_secrets(agent_name: str, tools_and_data_mcp_commands_secrets: Dict[str, Any]) -> None:
     """
@@ -140,6 +203,7 @@ def set_tools_and_data_mcp_commands_secrets(agent_name: str, tools_and_data_mcp_
     """
     json_string = json.dumps(tools_and_data_mcp_commands_secrets)
     global_tools_and_data_mcp_commands_secrets[agent_name] = json_string
+    _bump_config_fingerprint(agent_name)
 
 
 def get_tools_and_data_mcp_commands_secrets_by_module(agent_name: str, python_code_module: str) -> Dict[str, Any]:
@@ -155,7 +219,23 @@ def get_tools_and_data_mcp_commands_secrets_by_module(agent_name: str, python_co
     Returns:
         Dictionary containing combined common and module-specific secrets
     """
-    tools_and_data_mcp_commands_secrets = get_tools_and_data_mcp_commands_secrets(agent_name)
+    if agent_name not in global_tools_and_data_mcp_commands_secrets:
+        logger.warning(f"No MCP commands secrets found for agent: {agent_name}")
+        return {}
+
+    # Copy so callers can't modify the cached result
+    return dict(_merge_module_secrets(agent_name, config_fingerprint(agent_name), python_code_module))
+
+@functools.lru_cache(maxsize=64)
+def _merge_module_secrets(agent_name: str, fingerprint: int, python_code_module: str) -> Dict[str, Any]:
+    """
+    Parse the agent's stored secrets and merge 'common' with the module's 'internal_params'.
+
+    Keyed on (agent_name, config_fingerprint), which changes whenever the
+    secrets are set, so a reload is picked up without explicit invalidation
+    and repeat lookups skip the parse and the scan.
+    """
+    tools_and_data_mcp_commands_secrets = json.loads(global_tools_and_data_mcp_commands_secrets[agent_name])
     result = {}
     
     # Always include common elements if they exist
@@ -179,6 +259,19 @@ def get_tools_and_data_mcp_commands_secrets_by_module(agent_name: str, python_co
     
     return result
 
+def get_tools_and_data_mcp_commands_secrets_json(agent_name: str) -> Optional[str]:
+    """
+    Retrieve the stored (unparsed) MCP commands secrets
+    
+    Args:
+        agent_name: Name of the agent
+        
+    Returns:
+        The JSON string as stored by the setter, or None if not configured.
+        Use config_fingerprint() to detect configuration changes.
+    """
+    return global_tools_and_data_mcp_commands_secrets.get(agent_name)
+
 def get_tools_and_data_mcp_commands_secrets(agent_name: str) -> Dict[str, Any]:
     """
     Retrieve and parse MCP commands secrets
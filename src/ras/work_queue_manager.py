@@ -12,10 +12,11 @@ Author: David McKee
 import sys
 import threading
 import queue
-import json
 import importlib
 
-from typing import Callable, Dict, Any
+import orjson
+
+from typing import Callable, Dict, Any, Union
 from pathlib import Path
 
 SRC_DIR = Path(__file__).resolve().parent.parent.parent # Go up three levels: discord -> input_triggers -> src
@@ -26,11 +27,12 @@ from ras.agent_config_buffer import get_chat_model_config, get_output_action_con
 from tools_and_data.mcp_command_helper import contains_mcp_command, process_mcp_commands, escape_system_text_with_command_escape_text
 
 # Global thread-safe work queues
-chat_model_request_queue: queue.Queue[str] = queue.Queue()
-chat_model_response_queue: queue.Queue[str] = queue.Queue()
-input_trigger_queue: queue.Queue[str] = queue.Queue()
-output_action_queue: queue.Queue[str] = queue.Queue()
-tools_and_data_queue: queue.Queue[str] = queue.Queue()
+# Payloads are kept as orjson-encoded bytes end-to-end; consumers decode lazily.
+chat_model_request_queue: queue.Queue[bytes] = queue.Queue()
+chat_model_response_queue: queue.Queue[bytes] = queue.Queue()
+input_trigger_queue: queue.Queue[bytes] = queue.Queue()
+output_action_queue: queue.Queue[bytes] = queue.Queue()
+tools_and_data_queue: queue.Queue[bytes] = queue.Queue()
 
 QUEUE_NAME_CHAT_MODEL_REQUEST = "ChatModelRequest"
 QUEUE_NAME_CHAT_MODEL_RESPONSE = "ChatModelResponse"
@@ -48,10 +50,8 @@ def enqueue_chat_model_request(agent_name: str, prompt: str) -> None:
     message = {}
     message["agent_name"] = agent_name
     message["prompt"] = prompt
-    
-    contents = json.dumps(message)
 
-    chat_model_request_queue.put(contents)
+    chat_model_request_queue.put(orjson.dumps(message))
 
 def enqueue_chat_model_response(agent_name: str, response: str, meta_data: dict) -> None:
     """
@@ -65,10 +65,8 @@ def enqueue_chat_model_response(agent_name: str, response: str, meta_data: dict)
     contents["agent_name"] = agent_name
     contents["response"] = response
     contents["meta_data"] = meta_data
-    
-    json_string = json.dumps(contents)
 
-    chat_model_response_queue.put(json_string)
+    chat_model_response_queue.put(orjson.dumps(contents))
 
 
 def enqueue_input_trigger(agent_name: str, prompt: str, meta_data: Dict) -> None:
@@ -82,10 +80,8 @@ def enqueue_input_trigger(agent_name: str, prompt: str, meta_data: Dict) -> None
     contents["agent_name"] = agent_name
     contents["prompt"] = prompt
     contents["meta_data"] = meta_data
-  
-    json_string = json.dumps(contents) 
 
-    input_trigger_queue.put(json_string)
+    input_trigger_queue.put(orjson.dumps(contents))
 
 
 def enqueue_output_action(agent_name: str, chat_model_response: str, meta_data: Dict) -> None:
@@ -100,19 +96,19 @@ def enqueue_output_action(agent_name: str, chat_model_response: str, meta_data:
     message["agent_name"] = agent_name
     message["response"] = chat_model_response
     message["meta_data"] = meta_data
-    
-    contents = json.dumps(message)
 
-    output_action_queue.put(contents)
+    output_action_queue.put(orjson.dumps(message))
 
 
-def enqueue_tools_and_data(agent_name: str, contents: str) -> None:
+def enqueue_tools_and_data(agent_name: str, contents: Union[str, bytes]) -> None:
     """
     Enqueue work for the tools and data queue.
 
     :param agent_name: Name of the agent submitting the task
-    :param contents: A JSON string describing the task
+    :param contents: A JSON string (or UTF-8 bytes) describing the task
     """
+    if isinstance(contents, str):
+        contents = contents.encode("utf-8")
     tools_and_data_queue.put(contents)
 
 def get_python_code_module(python_code_module: str):
@@ -202,7 +198,8 @@ def process_chat_model_response(task_data: dict):
     response = task_data["response"]
     meta_data = task_data.get("meta_data", {})
 
-    if contains_mcp_command(agent_name, response):
+    matched_command = contains_mcp_command(agent_name, response)
+    if matched_command is not None:
         immediate_response = escape_system_text_with_command_escape_text(response)
 
         # Chat back that we are still processing
@@ -210,7 +207,7 @@ def process_chat_model_response(task_data: dict):
 
         # Generate the new prompt with command results
         initial_prompt = meta_data.get("initial_prompt", "")
-        next_prompt = process_mcp_commands(agent_name, response, initial_prompt)
+        next_prompt = process_mcp_commands(agent_name, response, initial_prompt, matched_command)
 
         # Check for recustion
         DEFAULT_MAX_RECURSION_DEPTH = 3 # Allow initial call + 2 rounds of MCP commands
@@ -277,7 +274,7 @@ def _load_and_execute_module(queue_name: str, task_data: dict) -> None:
         print(f"[ERROR] Failed to process {queue_name}.: {e}")
 
 
-def _start_queue_worker(queue_name: str, task_queue: queue.Queue[str]) -> None:
+def _start_queue_worker(queue_name: str, task_queue: queue.Queue[bytes]) -> None:
     """
     Start a background thread that dequeues and processes tasks for a queue.
 
@@ -288,7 +285,7 @@ def _start_queue_worker(queue_name: str, task_queue: queue.Queue[str]) -> None:
         while True:
             try:
                 task_json = task_queue.get()
-                task = json.loads(task_json)
+                task = orjson.loads(task_json)
                 _load_and_execute_module(queue_name, task)
             except Exception as e:
                 print(f"[ERROR] {queue_name} queue processing failed: {e}")
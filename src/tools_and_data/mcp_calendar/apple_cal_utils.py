@@ -1,6 +1,22 @@
-from caldav import DAVClient
-from caldav.lib.error import AuthorizationError
-from requests.auth import HTTPBasicAuth
+import functools
+
+ICLOUD_CALDAV_URL = "https://caldav.icloud.com/"
+
+
+@functools.lru_cache(maxsize=8)
+def _client_for(username: str, app_password: str):
+    """
+    Return a cached CalDAV client for the given credentials.
+
+    DAVClient keeps a single requests.Session internally, so reusing the
+    client reuses the pooled TCP+TLS connection across calls.
+    """
+    # Imported lazily so agents that never touch calendars don't pay the cost.
+    from caldav import DAVClient
+    from requests.auth import HTTPBasicAuth
+
+    return DAVClient(ICLOUD_CALDAV_URL, auth=HTTPBasicAuth(username, app_password))
+
 
 def discover_icloud_calendars(username: str, app_password: str) -> None:
     """
@@ -9,9 +25,10 @@ def discover_icloud_calendars(username: str, app_password: str) -> None:
     :param username: iCloud email address (usually Apple ID email)
     :param app_password: App-specific password generated at appleid.apple.com
     """
-    url = "https://caldav.icloud.com/"
+    from caldav.lib.error import AuthorizationError
+
     try:
-        client = DAVClient(url, auth=HTTPBasicAuth(username, app_password))
+        client = _client_for(username, app_password)
         principal = client.principal()
         calendars = principal.calendars()
 
@@ -26,5 +43,7 @@ def discover_icloud_calendars(username: str, app_password: str) -> None:
     except Exception as e:
         print(f"❌ Error: {str(e)}")
 
-# Replace with your credentials
-discover_icloud_calendars("someone@icloud.com", "abc-123")
+
+if __name__ == "__main__":
+    # Replace with your credentials
+    discover_icloud_calendars("someone@icloud.com", "abc-123")
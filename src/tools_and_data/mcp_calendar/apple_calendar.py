@@ -26,26 +26,36 @@ Requirements
 ------------
 ::
 
-    pip install caldav python-dateutil requests
+    pip install caldav numpy orjson python-dateutil requests
 
 Storage layout
 --------------
 * Event JSON records live in ``~/ram_data/horizons/events/<uid>.json``.
+* Every write is also appended to ``~/ram_data/horizons/events/events.jsonl``
+  (deletes as tombstones) so list-style commands read the store in one
+  sequential pass instead of opening every event file.
 * Daily JSON-Lines logs live in ``~/ram_data/logs/cal_concierge_<YYYY-MM-DD>.jsonl``.
 """
 
 from __future__ import annotations
 
-import json
+import atexit
+import bisect
+import functools
+import hashlib
 import os
-import uuid
-import dateutil
+import queue
+import re
+import threading
+import time
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, BinaryIO, Dict, Iterable, List, Tuple, Optional
 
-import dateutil.parser
+import numpy as np
+import orjson
 
 from src.tools_and_data.mcp_calendar.calendar_integration import (
     build_vevent,
@@ -63,43 +73,272 @@ from ras.agent_config_buffer import get_tools_and_data_mcp_commands_secrets_by_m
 STORE_DIR = Path(os.path.expanduser("~/ram_data/horizons/events"))
 LOG_DIR = Path(os.path.expanduser("~/ram_data/logs"))
 STORE_DIR.mkdir(parents=True, exist_ok=True)
+JOURNAL_PATH = STORE_DIR / "events.jsonl"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 # America/New_York (EDT / EST handled by dateutil)
 TZ_DEFAULT = timezone(timedelta(hours=-4))
 
 
+# Open append-mode handles keyed by daily log path; rotated when the date changes.
+_LOG_HANDLES: Dict[Path, BinaryIO] = {}
+_LOG_LOCK = threading.Lock()
+
+# _log() only enqueues; a daemon thread coalesces entries into one write per batch.
+_LOG_QUEUE: "queue.SimpleQueue[Optional[Tuple[Path, bytes]]]" = queue.SimpleQueue()
+_LOG_FLUSH_INTERVAL = 0.05  # seconds
+_LOG_BATCH_SIZE = 100
+_log_writer_thread: Optional[threading.Thread] = None
+
+
+def _log_handle(log_path: Path) -> BinaryIO:
+    """Return the cached handle for *log_path*, closing handles for older days."""
+    fh = _LOG_HANDLES.get(log_path)
+    if fh is None:
+        for stale_path in list(_LOG_HANDLES):
+            _LOG_HANDLES.pop(stale_path).close()
+        fh = log_path.open("ab")
+        _LOG_HANDLES[log_path] = fh
+    return fh
+
+
+def _write_log_batch(batch: List[Tuple[Path, bytes]]) -> None:
+    by_path: Dict[Path, List[bytes]] = {}
+    for log_path, line in batch:
+        by_path.setdefault(log_path, []).append(line)
+    with _LOG_LOCK:
+        for log_path, lines in by_path.items():
+            fh = _log_handle(log_path)
+            fh.writelines(lines)
+            fh.flush()
+
+
+def _log_writer() -> None:
+    """Drain the log queue every flush interval (or once a batch fills up)."""
+    while True:
+        item = _LOG_QUEUE.get()
+        if item is None:
+            return
+        batch = [item]
+        deadline = time.monotonic() + _LOG_FLUSH_INTERVAL
+        while len(batch) < _LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _LOG_QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                _write_log_batch(batch)
+                return
+            batch.append(item)
+        _write_log_batch(batch)
+
+
+def _ensure_log_writer() -> None:
+    global _log_writer_thread
+    if _log_writer_thread is None:
+        with _LOG_LOCK:
+            if _log_writer_thread is None:
+                _log_writer_thread = threading.Thread(
+                    target=_log_writer, name="cal-concierge-log", daemon=True
+                )
+                _log_writer_thread.start()
+
+
+@atexit.register
+def _close_logs() -> None:
+    """Stop the writer, write anything still queued, then fsync and close."""
+    if _log_writer_thread is not None:
+        _LOG_QUEUE.put(None)
+        _log_writer_thread.join(timeout=1.0)
+
+    pending: List[Tuple[Path, bytes]] = []
+    while True:
+        try:
+            item = _LOG_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        if item is not None:
+            pending.append(item)
+    if pending:
+        _write_log_batch(pending)
+
+    with _LOG_LOCK:
+        while _LOG_HANDLES:
+            _, fh = _LOG_HANDLES.popitem()
+            fh.flush()
+            os.fsync(fh.fileno())
+            fh.close()
+
+
 def _log(action: str, payload: Dict[str, Any]) -> None:
-    """Append a JSON-line log for auditing."""
-    log_path = LOG_DIR / f"cal_concierge_{datetime.now(timezone.utc).date()}.jsonl"
+    """Queue a JSON-line log entry for auditing."""
+    now = datetime.now(timezone.utc)
+    log_path = LOG_DIR / f"cal_concierge_{now.date()}.jsonl"
     entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": now.isoformat(),
         "action": action,
         **payload,
     }
-    with log_path.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    _ensure_log_writer()
+    _LOG_QUEUE.put((log_path, orjson.dumps(entry) + b"\n"))
+
+
+def _dumps(obj: Any) -> str:
+    """Serialise a command result; orjson is C-implemented and always UTF-8."""
+    return orjson.dumps(obj).decode()
 
 
 def _uid() -> str:  # RFC-822 style UID helper
-    return uuid.uuid4().hex.upper()
+    return os.urandom(16).hex().upper()
 
 
 def _event_path(uid: str) -> Path:
     return STORE_DIR / f"{uid}.json"
 
 
+# path -> (st_mtime_ns, st_size, content digest, racy, parsed event)
+_PARSE_CACHE: Dict[str, Tuple[int, int, bytes, bool, Dict[str, Any]]] = {}
+# A file modified this close to when it was cached may change again without
+# its mtime moving, so such entries are re-verified by content hash.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+def _read_event_file(path: str, st: os.stat_result) -> Dict[str, Any]:
+    """
+    Parse an event file, reusing the cached dict while ``(mtime, size)`` match.
+
+    Returns a shallow copy so callers may patch top-level fields freely.
+    """
+    cached = _PARSE_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        if not cached[3]:
+            return dict(cached[4])
+        raw = _read_bytes(path)
+        if hashlib.blake2b(raw, digest_size=16).digest() == cached[2]:
+            if time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS:
+                _PARSE_CACHE[path] = cached[:3] + (False, cached[4])
+            return dict(cached[4])
+    else:
+        raw = _read_bytes(path)
+
+    event = orjson.loads(raw)
+    racy = time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS
+    _PARSE_CACHE[path] = (
+        st.st_mtime_ns, st.st_size, hashlib.blake2b(raw, digest_size=16).digest(), racy, event
+    )
+    return dict(event)
+
+
 def _load_event(uid: str) -> Dict[str, Any]:
-    p = _event_path(uid)
-    if not p.exists():
-        raise FileNotFoundError(f"Event {uid} not found.")
-    return json.loads(p.read_text(encoding="utf-8"))
+    path = os.path.join(STORE_DIR, f"{uid}.json")
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Event {uid} not found.") from None
+    return _read_event_file(path, st)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write *data* to ``<path>.tmp`` and rename it over *path*, so readers never see a torn file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
 
 def _save_event(event: Dict[str, Any]) -> None:
-    _event_path(event["uid"]).write_text(
-        json.dumps(event, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    with _STORE_LOCK:
+        _atomic_write(_event_path(event["uid"]), orjson.dumps(event))
+        _append_journal(event)
+
+
+# ---------------------------------------------------------------------
+# Append-only event journal
+# ---------------------------------------------------------------------
+
+_STORE_LOCK = threading.RLock()
+# Rewrite the journal once superseded records outnumber live events by this factor.
+_JOURNAL_COMPACT_RATIO = 2
+
+
+def _append_journal(record: Dict[str, Any]) -> None:
+    global _registry_stamp
+    line = orjson.dumps(record) + b"\n"
+    with _STORE_LOCK:
+        stamp = _journal_stamp()
+        if stamp is None:
+            _rebuild_journal()
+            _registry_stamp = None
+            return  # the rebuild already picked up the per-uid file
+
+        registry_fresh = stamp == _registry_stamp
+        with JOURNAL_PATH.open("ab") as fh:
+            fh.write(line)
+
+        if registry_fresh:
+            _registry_apply(record)
+            _registry_stamp = _journal_stamp()
+        else:
+            _registry_stamp = None
+
+
+def _journal_delete(uid: str) -> None:
+    _append_journal({"uid": uid, "_deleted": True})
+
+
+def _write_journal(events: Iterable[Dict[str, Any]]) -> None:
+    _atomic_write(JOURNAL_PATH, b"".join(orjson.dumps(e) + b"\n" for e in events))
+
+
+def _rebuild_journal() -> None:
+    """Seed the journal from the per-uid event files (one-time migration)."""
+    with _STORE_LOCK, os.scandir(STORE_DIR) as entries:
+        _write_journal(
+            _read_event_file(entry.path, entry.stat(follow_symlinks=False))
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        )
+
+
+def _iter_events() -> Iterable[Dict[str, Any]]:
+    """Return all live events from the journal (the last record per uid wins)."""
+    with _STORE_LOCK:
+        if not JOURNAL_PATH.exists():
+            _rebuild_journal()
+
+        events: Dict[str, Dict[str, Any]] = {}
+        records = 0
+        with JOURNAL_PATH.open("rb") as fh:
+            for line in fh:
+                records += 1
+                record = orjson.loads(line)
+                if record.get("_deleted"):
+                    events.pop(record["uid"], None)
+                else:
+                    events[record["uid"]] = record
+
+        if records > _JOURNAL_COMPACT_RATIO * max(len(events), 1):
+            _write_journal(events.values())
+
+    return events.values()
+
+
+@functools.lru_cache(maxsize=4096)
+def _fromisoformat(dt_str: str) -> Optional[datetime]:
+    """Memoised ``datetime.fromisoformat``; returns ``None`` for non-ISO input."""
+    try:
+        if dt_str.endswith("Z"):  # fromisoformat() only accepts "Z" on 3.11+
+            dt_str = dt_str[:-1] + "+00:00"
+        return datetime.fromisoformat(dt_str)
+    except ValueError:
+        return None
 
 
 def _parse_iso(dt_str: str, default_date_time: datetime = None) -> datetime:
@@ -112,10 +351,25 @@ def _parse_iso(dt_str: str, default_date_time: datetime = None) -> datetime:
     - Human-readable formats: 'May 10, 2025', '10 May 2025'
     - Slashed formats: '05/10/2025' (MM/DD/YYYY or DD/MM/YYYY depending on locale)
 
+    Stored values are produced by ``datetime.isoformat()``, so the C-implemented
+    ``datetime.fromisoformat`` handles the common case (memoised, as the same
+    ``dt_start`` strings are parsed on every list call); ``dateutil`` is only
+    imported and used for free-form caller input. Those results are not cached
+    because dateutil fills missing fields from the current date.
+
     :param date_text: A date string to parse.
     :param fallback: An ISO-formatted date string to use as fallback.
     :return: A timezone-aware datetime object.
     """
+    if not isinstance(dt_str, str):
+        return default_date_time
+
+    parsed = _fromisoformat(dt_str)
+    if parsed is not None:
+        return parsed
+
+    import dateutil.parser
+
     try:
         return dateutil.parser.parse(dt_str)
     except (ValueError, TypeError):
@@ -129,9 +383,237 @@ def _parse_iso(dt_str: str, default_date_time: datetime = None) -> datetime:
     return default_date_time 
 
 
-def _within_window(event: Dict[str, Any], win_from: datetime, win_to: datetime) -> bool:
-    start = _parse_iso(event["dt_start"], None).astimezone(timezone.utc)
-    return win_from <= start <= win_to
+_DUR_RE = re.compile(r"^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_duration(iso: str) -> timedelta:
+    """Parse an ISO-8601 ``P#DT#H#M#S`` duration (e.g. ``PT45M``, ``P1D``) into a :class:`timedelta`."""
+    match = _DUR_RE.match(iso)
+    if not match or iso == "P":
+        raise ValueError(f"Unsupported duration: {iso!r}")
+    days, hours, minutes, seconds = (int(g) if g else 0 for g in match.groups())
+    return timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+
+
+def _stamp_utc_bounds(event: Dict[str, Any], dt_start: datetime, duration: timedelta) -> None:
+    """Persist UTC start/end so read paths never re-derive them from the duration."""
+    start_utc = dt_start.astimezone(timezone.utc)
+    event["dt_start_utc"] = start_utc.isoformat()
+    event["dt_end_utc"] = (start_utc + duration).isoformat()
+
+
+def _start_utc(event: Dict[str, Any]) -> datetime:
+    if "dt_start_utc" in event:
+        return _parse_iso(event["dt_start_utc"])
+    return _parse_iso(event["dt_start"], None).astimezone(timezone.utc)
+
+
+def _event_bounds_utc(event: Dict[str, Any]) -> Tuple[datetime, datetime]:
+    """UTC (start, end) for *event*, using the stored bounds when present."""
+    start = _start_utc(event)
+    if "dt_end_utc" in event:
+        return start, _parse_iso(event["dt_end_utc"])
+    return start, start + _parse_duration(event["duration"])
+
+
+# ---------------------------------------------------------------------
+# In-process event registry
+# ---------------------------------------------------------------------
+
+# uid -> event, plus (utc_start, uid) pairs kept sorted for window queries.
+_EVENT_CACHE: Dict[str, Dict[str, Any]] = {}
+_EVENTS_BY_START: List[Tuple[datetime, str]] = []
+# (st_mtime_ns, st_size) of the journal the registry was built from.
+_registry_stamp: Optional[Tuple[int, int]] = None
+# Upper bound on any registered event's duration; only grows between reloads,
+# which keeps it a valid bound for overlap queries.
+_max_duration = timedelta(0)
+
+# uid -> lowercased summary/description/horizon, built when an event enters
+# the registry so searches are a single substring test per event.
+_HAYSTACKS: Dict[str, str] = {}
+
+# Column view of _EVENTS_BY_START (naive-UTC datetime64[us]; NaT when an end
+# cannot be derived), rebuilt lazily after the registry changes.
+_STARTS = np.empty(0, dtype="datetime64[us]")
+_ENDS = np.empty(0, dtype="datetime64[us]")
+_UIDS = np.empty(0, dtype=object)
+_arrays_dirty = True
+
+
+def _journal_stamp() -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(JOURNAL_PATH)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _start_key(event: Dict[str, Any]) -> Optional[Tuple[datetime, str]]:
+    try:
+        return _start_utc(event), event["uid"]
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None  # unparseable dt_start never matches a window
+
+
+def _track_duration(event: Dict[str, Any]) -> None:
+    global _max_duration
+    try:
+        start, end = _event_bounds_utc(event)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return
+    duration = end - start
+    if duration > _max_duration:
+        _max_duration = duration
+
+
+def _haystack(event: Dict[str, Any]) -> str:
+    return " ".join(
+        [
+            event.get("summary", ""),
+            event.get("description", ""),
+            event.get("horizon", ""),
+        ]
+    ).lower()
+
+
+def _registry_apply(record: Dict[str, Any]) -> None:
+    """Apply one journal record (event or tombstone) to the registry."""
+    global _arrays_dirty
+    _arrays_dirty = True
+    uid = record["uid"]
+    previous = _EVENT_CACHE.pop(uid, None)
+    _HAYSTACKS.pop(uid, None)
+    if previous is not None:
+        key = _start_key(previous)
+        if key is not None:
+            idx = bisect.bisect_left(_EVENTS_BY_START, key)
+            if idx < len(_EVENTS_BY_START) and _EVENTS_BY_START[idx] == key:
+                del _EVENTS_BY_START[idx]
+
+    if record.get("_deleted"):
+        return
+
+    _EVENT_CACHE[uid] = record
+    _HAYSTACKS[uid] = _haystack(record)
+    _track_duration(record)
+    key = _start_key(record)
+    if key is not None:
+        bisect.insort(_EVENTS_BY_START, key)
+
+
+def _registry() -> Dict[str, Dict[str, Any]]:
+    """Return the uid -> event registry, reloading it if the journal changed on disk."""
+    global _registry_stamp, _max_duration, _arrays_dirty
+    with _STORE_LOCK:
+        stamp = _journal_stamp()
+        if stamp is None or stamp != _registry_stamp:
+            _arrays_dirty = True
+            events = list(_iter_events())
+            _EVENT_CACHE.clear()
+            _HAYSTACKS.clear()
+            _EVENTS_BY_START.clear()
+            _max_duration = timedelta(0)
+            for event in events:
+                _EVENT_CACHE[event["uid"]] = event
+                _HAYSTACKS[event["uid"]] = _haystack(event)
+                _track_duration(event)
+                key = _start_key(event)
+                if key is not None:
+                    _EVENTS_BY_START.append(key)
+            _EVENTS_BY_START.sort()
+            _registry_stamp = _journal_stamp()
+        return _EVENT_CACHE
+
+
+def _to_datetime64(dt: datetime) -> np.datetime64:
+    return np.datetime64(dt.astimezone(timezone.utc).replace(tzinfo=None), "us")
+
+
+def _index_arrays() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(_STARTS, _ENDS, _UIDS)``, rebuilding them from the registry if stale."""
+    global _STARTS, _ENDS, _UIDS, _arrays_dirty
+    registry = _registry()
+    if _arrays_dirty:
+        ends = []
+        for _, uid in _EVENTS_BY_START:
+            try:
+                ends.append(_to_datetime64(_event_bounds_utc(registry[uid])[1]))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                ends.append(np.datetime64("NaT", "us"))
+        _STARTS = np.array(
+            [_to_datetime64(start) for start, _ in _EVENTS_BY_START], dtype="datetime64[us]"
+        )
+        _ENDS = np.array(ends, dtype="datetime64[us]")
+        _UIDS = np.array([uid for _, uid in _EVENTS_BY_START], dtype=object)
+        _arrays_dirty = False
+    return _STARTS, _ENDS, _UIDS
+
+
+def _events_starting_between(win_from: datetime, win_to: datetime) -> List[Dict[str, Any]]:
+    """Events whose UTC start is in ``[win_from, win_to]``."""
+    with _STORE_LOCK:
+        starts, _, uids = _index_arrays()
+        lo = np.searchsorted(starts, _to_datetime64(win_from), side="left")
+        hi = np.searchsorted(starts, _to_datetime64(win_to), side="right")
+        return [_EVENT_CACHE[uid] for uid in uids[lo:hi]]
+
+
+def _events_overlapping(win_from: datetime, win_to: datetime) -> List[Dict[str, Any]]:
+    """
+    Events whose ``[start, end]`` overlaps ``[win_from, win_to]``.
+
+    Anything starting before ``win_from - _max_duration`` has already ended, so
+    only the start-sorted slice from there to ``win_to`` is tested, with one
+    vectorised comparison of the end column.
+    """
+    with _STORE_LOCK:
+        starts, ends, uids = _index_arrays()
+        lo = np.searchsorted(starts, _to_datetime64(win_from - _max_duration), side="left")
+        hi = np.searchsorted(starts, _to_datetime64(win_to), side="right")
+        overlapping = uids[lo:hi][ends[lo:hi] >= _to_datetime64(win_from)]
+        return [_EVENT_CACHE[uid] for uid in overlapping]
+
+
+# ---------------------------------------------------------------------
+# Background CalDAV pushes
+# ---------------------------------------------------------------------
+
+# CalDAV round-trips take hundreds of ms, so handlers store the event locally,
+# hand the push to this pool and return straight away.
+_PUSH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="caldav-push")
+
+
+@atexit.register  # registered after _close_logs, so it runs first
+def _drain_pushes() -> None:
+    """Let queued pushes finish so their results reach the store and the log."""
+    _PUSH_EXECUTOR.shutdown(wait=True)
+
+
+def _on_created(uid: str, future: Future) -> None:
+    """Record the CalDAV UID (or .ics fallback) once a create push completes."""
+    try:
+        cal_uid, ics_path = future.result()
+    except Exception as exc:  # noqa: BLE001
+        _log("push_failed", {"uid": uid, "message": str(exc)})
+        return
+
+    with _STORE_LOCK:
+        try:
+            event = _load_event(uid)
+        except FileNotFoundError:
+            return  # deleted before the push finished
+        event["calendar_uid"] = cal_uid
+        if ics_path:
+            event["fallback_path"] = str(ics_path)
+        _save_event(event)
+
+
+def _on_pushed(uid: str, future: Future) -> None:
+    exc = future.exception()
+    if exc is not None:
+        _log("push_failed", {"uid": uid, "message": str(exc)})
 
 
 # ---------------------------------------------------------------------
@@ -155,7 +637,7 @@ def create_event(command_parameters: Dict[str, Any], internal_params: Dict[str,
         del data["model_parameters"]
 
         # Load the model paramers as json
-        model_data = json.loads(model_parameters)
+        model_data = orjson.loads(model_parameters)
 
         # Copy the values to data.
         data.update(model_data)
@@ -166,15 +648,8 @@ def create_event(command_parameters: Dict[str, Any], internal_params: Dict[str,
         tzinfo = timezone.utc if data["timezone"].upper() == "UTC" else TZ_DEFAULT
         dt_start = _parse_iso(data["dt_start"]).astimezone(tzinfo)
 
-        # crude ISO-8601 duration parse (PT#H#M)
         if "duration" in data:
-            iso = data["duration"]
-            hours = int(iso.split("T")[1].split("H")[0]) if "H" in iso else 0
-            minutes = (
-                int(iso.split("H")[1].split("M")[0]) if "H" in iso and "M" in iso else
-                int(iso.split("T")[1].split("M")[0]) if "M" in iso else 0
-            )
-            duration_td = timedelta(hours=hours, minutes=minutes)
+            duration_td = _parse_duration(data["duration"])
         else:
             duration_td = _parse_iso(data["dt_end"]) - dt_start
 
@@ -194,7 +669,15 @@ def create_event(command_parameters: Dict[str, Any], internal_params: Dict[str,
         username = tools_and_data_mcp_commands_secrets["ICLOUD_USER"]
         app_password = tools_and_data_mcp_commands_secrets["ICLOUD_APP_PASSWORD"]
 
-        cal_uid, ics_path = create_and_push_event(
+        # calendar_uid is filled in by _on_created once the push completes.
+        data["calendar_uid"] = None
+
+        _stamp_utc_bounds(data, dt_start, duration_td)
+        _save_event(data)
+        _log("create", {"uid": uid})
+
+        push = _PUSH_EXECUTOR.submit(
+            create_and_push_event,
             summary=data["summary"],
             description=data.get("description", ""),
             dt_start=dt_start,
@@ -203,17 +686,11 @@ def create_event(command_parameters: Dict[str, Any], internal_params: Dict[str,
             username=username,
             app_password=app_password
         )
+        push.add_done_callback(functools.partial(_on_created, uid))
 
-        data["calendar_uid"] = cal_uid
-        if ics_path:
-            data["fallback_path"] = str(ics_path)
-
-        _save_event(data)
-        _log("create", {"uid": uid})
-
-        return json.dumps({"status": "ok", "data": data, "uid": uid})
+        return _dumps({"status": "ok", "data": data, "uid": uid})
     except Exception as exc:  # noqa: BLE001
-        return json.dumps(
+        return _dumps(
             {"status": "error", "error": {"code": "internal", "message": str(exc)}}
         )
 
@@ -225,9 +702,9 @@ def get_event(command_parameters: Dict[str, Any], internal_params: Dict[str, Any
     try:
         uid = command_parameters["model_parameters"] # only returns the uid
         event = _load_event(uid)
-        return json.dumps({"status": "ok", "data": event})
+        return _dumps({"status": "ok", "data": event})
     except FileNotFoundError:
-        return json.dumps(
+        return _dumps(
             {"status": "error", "error": {"code": "not_found", "message": "uid not found"}}
         )
 
@@ -246,16 +723,12 @@ def list_events(command_parameters: Dict[str, Any], internal_params: Dict[str, A
         win_to = _parse_iso(
             to_date_text, (now + timedelta(days=7)))
 
-        events = []
-        for file in STORE_DIR.glob("*.json"):
-            event = json.loads(file.read_text(encoding="utf-8"))
-            if _within_window(event, win_from, win_to):
-                events.append(event)
+        events = _events_starting_between(win_from, win_to)
 
         events.sort(key=lambda e: e["dt_start"])
-        return json.dumps({"status": "ok", "data": events})
+        return _dumps({"status": "ok", "data": events})
     except Exception as exc:  # noqa: BLE001
-        return json.dumps(
+        return _dumps(
             {"status": "error", "error": {"code": "internal", "message": str(exc)}}
         )
 
@@ -267,23 +740,21 @@ def update_event(command_parameters: Dict[str, Any], internal_params: Dict[str,
     try:
         uid = command_parameters["uid"]
         patch = command_parameters.get("patch", {})
-        event = _load_event(uid)
+        with _STORE_LOCK:  # don't interleave with a push recording calendar_uid
+            event = _load_event(uid)
 
-        event.update(patch)
-        _save_event(event)
+            event.update(patch)
+
+            tzinfo = timezone.utc if event.get("timezone") == "UTC" else TZ_DEFAULT
+            dt_start = _parse_iso(event["dt_start"]).astimezone(tzinfo)
+
+            duration_td = _parse_duration(event["duration"])
+
+            _stamp_utc_bounds(event, dt_start, duration_td)
+            _save_event(event)
         _log("update", {"uid": uid})
 
         # Re-push to CalDAV
-        tzinfo = timezone.utc if event.get("timezone") == "UTC" else TZ_DEFAULT
-        dt_start = _parse_iso(event["dt_start"]).astimezone(tzinfo)
-
-        dur_iso = event["duration"]
-        hours = int(dur_iso.split("T")[1].split("H")[0]) if "H" in dur_iso else 0
-        minutes = (
-            int(dur_iso.split("H")[1].split("M")[0]) if "H" in dur_iso and "M" in dur_iso else
-            int(dur_iso.split("T")[1].split("M")[0]) if "M" in dur_iso else 0
-        )
-        duration_td = timedelta(hours=hours, minutes=minutes)
 
         vevent = build_vevent(
             summary=event["summary"],
@@ -293,20 +764,22 @@ def update_event(command_parameters: Dict[str, Any], internal_params: Dict[str,
             uid=uid,
         )
 
-        push_event_to_icloud(
+        push = _PUSH_EXECUTOR.submit(
+            push_event_to_icloud,
             vevent=vevent,
             calendar_url=os.getenv("ICLOUD_CALDAV_URL"),
             username=os.getenv("ICLOUD_USER"),
             app_password=os.getenv("ICLOUD_APP_PASSWORD"),
         )
+        push.add_done_callback(functools.partial(_on_pushed, uid))
 
-        return json.dumps({"status": "ok", "data": event, "uid": uid})
+        return _dumps({"status": "ok", "data": event, "uid": uid})
     except FileNotFoundError:
-        return json.dumps(
+        return _dumps(
             {"status": "error", "error": {"code": "not_found", "message": "uid not found"}}
         )
     except Exception as exc:  # noqa: BLE001
-        return json.dumps(
+        return _dumps(
             {"status": "error", "error": {"code": "internal", "message": str(exc)}}
         )
 
@@ -319,16 +792,15 @@ def delete_event(command_parameters: Dict[str, Any], internal_params: Dict[str,
         uid = command_parameters["uid"]
         scope = command_parameters.get("scope", "ALL")
         path = _event_path(uid)
-        if not path.exists():
-            raise FileNotFoundError
 
         # TODO: CalDAV DELETE (and RRULE rewrite for scope=THIS/FUTURE)
-        path.unlink()
+        path.unlink()  # raises FileNotFoundError for unknown uids
+        _journal_delete(uid)
         _log("delete", {"uid": uid, "scope": scope})
 
-        return json.dumps({"status": "ok", "uid": uid})
+        return _dumps({"status": "ok", "uid": uid})
     except FileNotFoundError:
-        return json.dumps(
+        return _dumps(
             {"status": "error", "error": {"code": "not_found", "message": "uid not found"}}
         )
 
@@ -352,24 +824,19 @@ def search_events(command_parameters: Dict[str, Any], internal_params: Dict[str,
         max_results = int(command_parameters.get("max_results", 50))
 
         matches: List[Dict[str, Any]] = []
-        for file in STORE_DIR.glob("*.json"):
-            event = json.loads(file.read_text(encoding="utf-8"))
-            haystack = " ".join(
-                [
-                    event.get("summary", ""),
-                    event.get("description", ""),
-                    event.get("horizon", ""),
-                ]
-            ).lower()
-            if query in haystack and _within_window(event, win_from, win_to):
-                matches.append(event)
-                if len(matches) >= max_results:
-                    break
+        with _STORE_LOCK:
+            candidates = _events_starting_between(win_from, win_to)
+            haystacks = _HAYSTACKS
+            for event in candidates:
+                if query in haystacks[event["uid"]]:
+                    matches.append(event)
+                    if len(matches) >= max_results:
+                        break
 
         matches.sort(key=lambda e: e["dt_start"])
-        return json.dumps({"status": "ok", "data": matches})
+        return _dumps({"status": "ok", "data": matches})
     except Exception as exc:  # noqa: BLE001
-        return json.dumps(
+        return _dumps(
             {"status": "error", "error": {"code": "internal", "message": str(exc)}}
         )
 
@@ -386,18 +853,8 @@ def free_busy(command_parameters: Dict[str, Any], internal_params: Dict[str, Any
         )
 
         busy_blocks: List[Tuple[datetime, datetime]] = []
-        for file in STORE_DIR.glob("*.json"):
-            event = json.loads(file.read_text(encoding="utf-8"))
-            start = _parse_iso(event["dt_start"]).astimezone(timezone.utc)
-
-            iso = event["duration"]
-            hours = int(iso.split("T")[1].split("H")[0]) if "H" in iso else 0
-            minutes = (
-                int(iso.split("H")[1].split("M")[0]) if "H" in iso and "M" in iso else
-                int(iso.split("T")[1].split("M")[0]) if "M" in iso else 0
-            )
-            dur = timedelta(hours=hours, minutes=minutes)
-            end = start + dur
+        for event in _events_overlapping(win_from, win_to):
+            start, end = _event_bounds_utc(event)
 
             if start <= win_to and end >= win_from:
                 busy_blocks.append((start, end))
@@ -412,9 +869,9 @@ def free_busy(command_parameters: Dict[str, Any], internal_params: Dict[str, Any
                 merged[-1][1] = max(merged[-1][1], blk[1])  # type: ignore[index]
 
         merged_iso = [{"start": s.isoformat(), "end": e.isoformat()} for s, e in merged]
-        return json.dumps({"status": "ok", "data": merged_iso})
+        return _dumps({"status": "ok", "data": merged_iso})
     except Exception as exc:  # noqa: BLE001
-        return json.dumps(
+        return _dumps(
             {"status": "error", "error": {"code": "internal", "message": str(exc)}}
         )
 
@@ -430,13 +887,7 @@ def export_ics(command_parameters: Dict[str, Any], internal_params: Dict[str, An
         tzinfo = timezone.utc if event.get("timezone") == "UTC" else TZ_DEFAULT
         dt_start = _parse_iso(event["dt_start"]).astimezone(tzinfo)
 
-        iso = event["duration"]
-        hours = int(iso.split("T")[1].split("H")[0]) if "H" in iso else 0
-        minutes = (
-            int(iso.split("H")[1].split("M")[0]) if "H" in iso and "M" in iso else
-            int(iso.split("T")[1].split("M")[0]) if "M" in iso else 0
-        )
-        duration_td = timedelta(hours=hours, minutes=minutes)
+        duration_td = _parse_duration(event["duration"])
 
         vevent = build_vevent(
             summary=event["summary"],
@@ -449,14 +900,14 @@ def export_ics(command_parameters: Dict[str, Any], internal_params: Dict[str, An
         ics_path = Path(internal_params.get("export_dir", "~/Downloads")).expanduser() / f"{uid}.ics"
         write_ics_file(vevent, ics_path)
 
-        return json.dumps(
+        return _dumps(
             {"status": "ok", "data": {"download_url": f"file://{ics_path}"}, "uid": uid}
         )
     except FileNotFoundError:
-        return json.dumps(
+        return _dumps(
             {"status": "error", "error": {"code": "not_found", "message": "uid not found"}}
         )
     except Exception as exc:  # noqa: BLE001
-        return json.dumps(
+        return _dumps(
             {"status": "error", "error": {"code": "internal", "message": str(exc)}}
         )
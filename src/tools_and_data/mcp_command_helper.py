@@ -1,10 +1,20 @@
 import os
+import re
 import sys
+import json
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 from importlib.util import spec_from_file_location, module_from_spec
 
+try:
+    import ahocorasick
+except ImportError:  # contains_mcp_command falls back to a compiled regex
+    ahocorasick = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,7 +27,275 @@ SRC_DIR = Path(__file__).resolve().parent.parent
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from ras.agent_config_buffer import get_tools_and_data_mcp_commands_config, get_tools_and_data_mcp_commands_secrets
+from ras.agent_config_buffer import (
+    config_fingerprint,
+    get_tools_and_data_mcp_commands_config,
+    get_tools_and_data_mcp_commands_config_json,
+    get_tools_and_data_mcp_commands_secrets,
+    get_tools_and_data_mcp_commands_secrets_json,
+)
+
+class MatchedCommand(NamedTuple):
+    """A command found by :func:`contains_mcp_command`, handed to :func:`process_mcp_commands`."""
+    matched_text: str          # the system_text or alias that matched
+    is_alias: bool
+    commands: Tuple[str, ...]  # commands the response's leading word selects, longest first
+
+
+# Upper bound on commands from one response that run at the same time.
+MAX_COMMAND_WORKERS = 8
+
+# Loaded MCP handler modules keyed by module path: (st_mtime_ns, module).
+_MODULE_CACHE: Dict[str, Tuple[int, ModuleType]] = {}
+_MODULE_CACHE_LOCK = threading.Lock()
+
+# Handler lookups keyed by (module path, handler name): (module, handler or None).
+_HANDLER_CACHE: Dict[Tuple[str, str], Tuple[ModuleType, Optional[Callable[..., Any]]]] = {}
+
+# Loaded modules are registered in sys.modules under this package-style
+# prefix, so a handler file named like an installed package (lightrag.py)
+# can't shadow it.
+_MODULE_NAMESPACE = "ras_mcp_commands"
+
+# Every per-agent cache below stores the agent's config_fingerprint() next to
+# its payload and rebuilds only when the fingerprint has moved on.
+
+# Parsed MCP commands config per agent: (fingerprint, config). Shared between
+# calls, so it must be treated as read-only.
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Secrets per agent: (fingerprint, (common params, {module path: common params
+# merged with the module's internal_params})). The params dicts are handed to
+# every handler call, so they are read-only.
+_SECRETS_CACHE: Dict[str, Tuple[int, Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]]] = {}
+
+# Structures derived from an agent's config, keyed by (agent_name, name).
+_DERIVED_CACHE: Dict[Tuple[str, str], Tuple[int, Any]] = {}
+
+
+def _get_commands_config(agent_name: str) -> Dict[str, Any]:
+    """Return the agent's MCP commands config, parsing it only when it changes."""
+    fingerprint = config_fingerprint(agent_name)
+    cached = _CONFIG_CACHE.get(agent_name)
+    if cached is None or cached[0] != fingerprint:
+        raw = get_tools_and_data_mcp_commands_config_json(agent_name)
+        if raw is None:
+            return get_tools_and_data_mcp_commands_config(agent_name)  # logs and returns {}
+
+        command_data = json.loads(raw)
+        _annotate_commands(command_data)
+        cached = (fingerprint, command_data)
+        _CONFIG_CACHE[agent_name] = cached
+    return cached[1]
+
+
+def _annotate_commands(command_data: Dict[str, Any]) -> None:
+    """
+    Store per-command values derived once when the config is parsed:
+
+    * ``_system_text_lower`` / ``_aliases_lower`` - lowercased patterns, so
+      matching structures never lowercase them again.
+    * ``_module_path`` / ``_module_stem`` - the resolved handler module path
+      and its stem, so dispatch doesn't rebuild them on every call.
+    """
+    for cmd in command_data.get("mcp_commands", []):
+        system_text = cmd.get("system_text")
+        cmd["_system_text_lower"] = system_text.lower() if system_text else system_text
+        cmd["_aliases_lower"] = [alias.lower() for alias in cmd.get("aliases", [])]
+
+        module_path_str = cmd.get("python_code_module")
+        if module_path_str:
+            cmd["_module_path"] = Path(module_path_str).resolve()
+            cmd["_module_stem"] = cmd["_module_path"].stem
+
+
+def _get_internal_params(agent_name: str) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Return the agent's common secret params and, per python_code_module, the
+    common params merged with that module's internal_params (specific taking
+    precedence; first entry wins). Rebuilt only when the secrets change.
+    """
+    fingerprint = config_fingerprint(agent_name)
+    cached = _SECRETS_CACHE.get(agent_name)
+    if cached is None or cached[0] != fingerprint:
+        raw = get_tools_and_data_mcp_commands_secrets_json(agent_name)
+        if raw is None:
+            secrets_data = get_tools_and_data_mcp_commands_secrets(agent_name)  # logs and returns {}
+            return secrets_data.get("common", {}), {}
+
+        secrets_data = json.loads(raw)
+        common_params = secrets_data.get("common", {})
+        merged_by_module: Dict[str, Dict[str, Any]] = {}
+        for secret_entry in secrets_data.get("secrets", []):
+            module_path_str = secret_entry.get("python_code_module")
+            if module_path_str not in merged_by_module:
+                merged_by_module[module_path_str] = {**common_params, **secret_entry.get("internal_params", {})}
+        cached = (fingerprint, (common_params, merged_by_module))
+        _SECRETS_CACHE[agent_name] = cached
+    return cached[1]
+
+
+def _get_derived(agent_name: str, name: str, build: Callable[[Dict[str, Any]], Any]) -> Any:
+    """Return ``build(config)`` for the agent, rebuilding only when the config changes."""
+    fingerprint = config_fingerprint(agent_name)
+    cached = _DERIVED_CACHE.get((agent_name, name))
+    if cached is None or cached[0] != fingerprint:
+        configured = get_tools_and_data_mcp_commands_config_json(agent_name) is not None
+        command_data = _get_commands_config(agent_name) if configured else {}
+        cached = (fingerprint, build(command_data))
+        _DERIVED_CACHE[(agent_name, name)] = cached
+    return cached[1]
+
+
+def _build_command_patterns(command_data: Dict[str, Any]) -> Tuple[Tuple[str, str, bool], ...]:
+    """
+    Flatten enabled commands into ``(lowered_text, text, is_alias)`` tuples.
+
+    Order follows the config: each command's system_text, then its aliases.
+    """
+    patterns = []
+    for cmd in command_data.get("mcp_commands", []):
+        if cmd.get("enabled") is False:
+            continue
+
+        system_text = cmd.get("system_text")
+        if system_text:
+            patterns.append((cmd["_system_text_lower"], system_text, False))
+        for alias, alias_lower in zip(cmd.get("aliases", []), cmd["_aliases_lower"]):
+            patterns.append((alias_lower, alias, True))
+    return tuple(patterns)
+
+
+def _build_command_index(command_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map each system_text to its command entry; the first entry wins."""
+    command_index: Dict[str, Dict[str, Any]] = {}
+    for cmd in command_data.get("mcp_commands", []):
+        command_index.setdefault(cmd.get("system_text"), cmd)
+    return command_index
+
+
+def _enabled_commands_by_length(command_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Enabled commands with a system_text, longest first so longer commands match first."""
+    commands = [
+        cmd
+        for cmd in command_data.get("mcp_commands", [])
+        if cmd.get("enabled") and "system_text" in cmd
+    ]
+    commands.sort(key=lambda cmd: len(cmd["system_text"]), reverse=True)
+    return commands
+
+
+def _build_leading_word_index(command_data: Dict[str, Any]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Map each lowered leading word to the enabled commands it selects.
+
+    A word selects a command when ``word + " "`` occurs in ``command + " "``
+    (case-insensitively), i.e. it is a space-free substring of the command
+    that ends at a space or at the command's end. Commands keep the
+    longest-first order of :func:`_enabled_commands_by_length`; a system_text
+    listed more than once appears once, since dispatch would run the same
+    (first) entry for each copy anyway.
+    """
+    index: Dict[str, list] = {}
+    seen = set()
+    for cmd in _enabled_commands_by_length(command_data):
+        command, lowered = cmd["system_text"], cmd["_system_text_lower"]
+        if command in seen:
+            continue
+        seen.add(command)
+        words = set()
+        for end in range(1, len(lowered) + 1):
+            if end < len(lowered) and lowered[end] != " ":
+                continue
+            start = lowered.rfind(" ", 0, end) + 1
+            for begin in range(start, end):
+                words.add(lowered[begin:end])
+        for word in words:
+            index.setdefault(word, []).append(command)
+    return {word: tuple(commands) for word, commands in index.items()}
+
+
+def _build_command_automaton(command_data: Dict[str, Any]) -> Optional["ahocorasick.Automaton"]:
+    """
+    Build an Aho-Corasick automaton over every enabled system_text and alias.
+
+    Values are ``(text, is_alias)``, for logging; the first occurrence of a
+    lowered pattern in config order wins. Returns None when the agent has no
+    patterns.
+    """
+    automaton = ahocorasick.Automaton()
+    for lowered_text, text, is_alias in _build_command_patterns(command_data):
+        if lowered_text not in automaton:
+            automaton.add_word(lowered_text, (text, is_alias))
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_command_regex(command_data: Dict[str, Any]) -> Optional[Tuple["re.Pattern[str]", Dict[str, Tuple[str, bool]]]]:
+    """
+    Fallback for :func:`_build_command_automaton` when pyahocorasick is missing.
+
+    Returns a case-insensitive alternation of every enabled system_text and
+    alias (longest first, so the longest pattern wins at a position) and a
+    map from lowered pattern to ``(text, is_alias)``, or None when the agent
+    has no patterns.
+    """
+    values: Dict[str, Tuple[str, bool]] = {}
+    for lowered_text, text, is_alias in _build_command_patterns(command_data):
+        values.setdefault(lowered_text, (text, is_alias))
+    if not values:
+        return None
+    alternation = "|".join(map(re.escape, sorted(values, key=len, reverse=True)))
+    return re.compile(alternation, re.IGNORECASE), values
+
+
+def _load_command_module(module_path: Path, module_stem: str) -> Optional[ModuleType]:
+    """
+    Load an MCP handler module once and reuse it until its file changes.
+
+    Returns None if no module spec can be created for the path; raises
+    FileNotFoundError if the file is missing.
+    """
+    module_path_str = str(module_path)
+    mtime_ns = os.stat(module_path_str).st_mtime_ns
+
+    cached = _MODULE_CACHE.get(module_path_str)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with _MODULE_CACHE_LOCK:
+        cached = _MODULE_CACHE.get(module_path_str)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        module_name = f"{_MODULE_NAMESPACE}.{module_stem}"
+        spec = spec_from_file_location(module_name, module_path)
+        if not spec or not spec.loader:
+            return None
+
+        cmd_mod = module_from_spec(spec)
+        # Registered before executing, as importlib does, so dataclasses,
+        # pickle and typing can resolve the module by its __name__.
+        sys.modules[module_name] = cmd_mod
+        try:
+            spec.loader.exec_module(cmd_mod)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        _MODULE_CACHE[module_path_str] = (mtime_ns, cmd_mod)
+        return cmd_mod
+
+
+def _get_handler(cmd_mod: ModuleType, module_path: Path, handler_name: str) -> Optional[Callable[..., Any]]:
+    """Return ``cmd_mod.<handler_name>`` (or None), cached until the module reloads."""
+    key = (str(module_path), handler_name)
+    cached = _HANDLER_CACHE.get(key)
+    if cached is None or cached[0] is not cmd_mod:
+        cached = (cmd_mod, getattr(cmd_mod, handler_name, None))
+        _HANDLER_CACHE[key] = cached
+    return cached[1]
 
 def escape_system_text_with_command_escape_text(response: str, command_escape_text: str = "(in progress...)"):
     """
@@ -41,40 +319,71 @@ def escape_system_text_with_command_escape_text(response: str, command_escape_te
     
     return response.strip()
 
-def contains_mcp_command(agent_name: str, message_text: str) -> bool:
+def _match_command_automaton(agent_name: str, message_text_lower: str) -> Optional[Tuple[str, bool]]:
+    automaton = _get_derived(agent_name, "command_automaton", _build_command_automaton)
+    if automaton is None:
+        return None
+
+    # One linear pass over the message, stopping at the first configured pattern.
+    for _end_index, value in automaton.iter(message_text_lower):
+        return value
+    return None
+
+
+def _match_command_regex(agent_name: str, message_text: str) -> Optional[Tuple[str, bool]]:
+    compiled = _get_derived(agent_name, "command_regex", _build_command_regex)
+    if compiled is None:
+        return None
+    pattern, values = compiled
+
+    # re.IGNORECASE spares lowercasing the whole message; one C-level scan.
+    for m in pattern.finditer(message_text):
+        value = values.get(m.group(0).lower())
+        if value is not None:  # None only if case folding and lower() disagree
+            return value
+    return None
+
+
+def contains_mcp_command(agent_name: str, message_text: str) -> Optional[MatchedCommand]:
     """
     Checks if the message text contains any known MCP command or alias.
     
+    All commands and aliases are found in one pass with the agent's
+    Aho-Corasick automaton, or with a compiled regex alternation if
+    pyahocorasick is missing. On a match, the commands the message's leading
+    word selects are looked up too, so :func:`process_mcp_commands` can run
+    them without resolving the response again.
+
     Args:
         agent_name: The name of the agent to check commands for.
         message_text: The message text to check for commands.
         
     Returns:
-        True if a command is found, False otherwise.
+        The match if a command is found, None otherwise.
     """
-    command_data = get_tools_and_data_mcp_commands_config(agent_name)   
+    command_data = _get_commands_config(agent_name)
     if not command_data:
-        logger.warning(f"No command data found for agent {agent_name}")
-        return False
+        logger.warning("No command data found for agent %s", agent_name)
+        return None
 
-    message_text_lower = message_text.lower().strip() # Case-insensitive check
     try:
-        for cmd in command_data.get("mcp_commands", []):
-            if cmd.get("enabled") is False:
-                continue
+        if ahocorasick is None:
+            match = _match_command_regex(agent_name, message_text.strip())
+        else:
+            match = _match_command_automaton(agent_name, message_text.lower().strip())
+
+        if match is None:
+            return None
 
-            system_text = cmd.get("system_text")
-            if system_text and system_text.lower() in message_text_lower:
-                logger.info(f"Found command '{system_text}' in message.")
-                return True
-            for alias in cmd.get("aliases", []):
-                if alias.lower() in message_text_lower:
-                    logger.info(f"Found command alias '{alias}' in message.")
-                    return True
-        return False
+        text, is_alias = match
+        if is_alias:
+            logger.debug("Found command alias '%s' in message.", text)
+        else:
+            logger.debug("Found command '%s' in message.", text)
+        return MatchedCommand(text, is_alias, _select_commands(agent_name, message_text))
     except Exception as e:
-        logger.error(f"Error during command checking: {e}", exc_info=True)
-        return False
+        logger.exception("Error during command checking: %s", e)
+        return None
     
 def extract_model_parameters(command_text, model_response):
     command_only = extract_command(command_text).strip()
@@ -96,77 +405,65 @@ def run_mcp_command(agent_name: str, command_text: str, model_response: str) ->
     Returns:
         The result of the command execution as a string.
     """
-    command_data = get_tools_and_data_mcp_commands_config(agent_name)
-    secrets_data = get_tools_and_data_mcp_commands_secrets(agent_name)
-
     try:
         # Find the command definition matching the exact system_text
-        matched_cmd = next(
-            (cmd for cmd in command_data.get("mcp_commands", [])
-                if cmd.get("system_text") == command_text),
-            None
-        )
+        command_index = _get_derived(agent_name, "command_index", _build_command_index)
+        matched_cmd = command_index.get(command_text)
         if not matched_cmd:
-            logger.warning(f"Unknown MCP command requested: {command_text}")
+            logger.warning("Unknown MCP command requested: %s", command_text)
             return f"Unknown MCP command: {command_text}"
 
         module_path_str = matched_cmd.get("python_code_module")
         handler_name = matched_cmd.get("handler_function", "execute_command")
 
         if not module_path_str:
-            logger.error(f"Command '{command_text}' is missing 'python_code_module' in config.")
+            logger.error("Command '%s' is missing 'python_code_module' in config.", command_text)
             return f"Configuration error for command: {command_text}"
 
-        # Convert string path to Path object
-        module_path = Path(module_path_str)
-        
-        if not module_path.exists():
-            logger.error(f"MCP module file not found: {module_path}")
+        # Path and stem are resolved once per config version
+        module_path = matched_cmd["_module_path"]
+
+        # Dynamically load (or reuse) the module; its mtime check doubles as the existence check
+        try:
+            cmd_mod = _load_command_module(module_path, matched_cmd["_module_stem"])
+        except FileNotFoundError:
+            logger.error("MCP module file not found: %s", module_path)
             return f"Error: Module file not found for command {command_text}"
+        if cmd_mod is None:
+            logger.error("Could not create module spec for %s", module_path)
+            return f"Error loading module for command {command_text}"
 
         # Load secrets for the module from MCP secrets file
-        common_params = secrets_data.get("common", {})
-        secret_entry = next(
-            (s for s in secrets_data.get("secrets", [])
-                if s.get("python_code_module") == module_path_str),
-            None
-        )
-        if not secret_entry:
-            logger.warning(f"Missing secrets entry for module: {module_path_str}")
+        # (common merged with module-specific params is precomputed per secrets version)
+        common_params, params_by_module = _get_internal_params(agent_name)
+        internal_params = params_by_module.get(module_path_str)
+        if internal_params is None:
+            logger.warning("Missing secrets entry for module: %s", module_path_str)
             internal_params = common_params # Use only common if specific are missing
-        else:
-            # Merge common with specific, specific taking precedence
-            internal_params = {**common_params, **secret_entry.get("internal_params", {})}
 
-        # Dynamically load and execute the module's handler function
-        spec = spec_from_file_location(module_path.stem, module_path)
-        if not spec or not spec.loader:
-            logger.error(f"Could not create module spec for {module_path}")
-            return f"Error loading module for command {command_text}"
-
-        cmd_mod = module_from_spec(spec)
-        spec.loader.exec_module(cmd_mod)
+        # The config is shared between calls, so work on a per-call copy.
+        command_parameters = dict(matched_cmd.get("command_parameters", {}))
 
         # extract parameters from the model response
         model_parameters = extract_model_parameters(command_text, model_response)
 
         if model_parameters:
-            matched_cmd["command_parameters"]["model_parameters"] = model_parameters
+            command_parameters["model_parameters"] = model_parameters
 
-        matched_cmd["command_parameters"]["agent_name"] = agent_name
+        command_parameters["agent_name"] = agent_name
         
-        if hasattr(cmd_mod, handler_name):
-            handler = getattr(cmd_mod, handler_name)
-            logger.info(f"Running MCP Command: {module_path}.{handler_name}")
-            result = handler(matched_cmd["command_parameters"], internal_params)
-            logger.info(f"MCP Command '{command_text}' result received.")
+        handler = _get_handler(cmd_mod, module_path, handler_name)
+        if handler is not None:
+            logger.info("Running MCP Command: %s.%s", module_path, handler_name)
+            result = handler(command_parameters, internal_params)
+            logger.info("MCP Command '%s' result received.", command_text)
             return str(result) # Ensure result is string
         else:
-            logger.error(f"Handler function '{handler_name}' not found in module {module_path}")
+            logger.error("Handler function '%s' not found in module %s", handler_name, module_path)
             return f"Error: Handler not found for command {command_text}"
 
     except Exception as e:
-        logger.error(f"Error executing MCP command '{command_text}': {e}", exc_info=True)
+        logger.exception("Error executing MCP command '%s': %s", command_text, e)
         return f"Error executing command {command_text}: {e}"
 
 def extract_command(input_string: str) -> Optional[str]:
@@ -185,9 +482,60 @@ def extract_command(input_string: str) -> Optional[str]:
     if not stripped:
         return None
 
-    return stripped.split(" ", 1)[0]
+    # Slice up to the first space; split/partition would also copy the (possibly long) remainder.
+    space = stripped.find(" ")
+    return stripped if space < 0 else stripped[:space]
+
+def _run_commands(agent_name: str, commands: Tuple[str, ...], gpt_response: str) -> List[str]:
+    """
+    Run *commands* and return their results in the same order.
+
+    Commands run concurrently on a thread pool unless their config entry sets
+    ``"thread_safe": false``; those run one after another on this thread once
+    every pooled command has finished, so they never overlap another command.
+    """
+    if len(commands) < 2:
+        return [run_mcp_command(agent_name, command, gpt_response) for command in commands]
+
+    command_index = _get_derived(agent_name, "command_index", _build_command_index)
+    concurrent = [
+        i for i, command in enumerate(commands)
+        if command_index.get(command, {}).get("thread_safe", True)
+    ]
+    if len(concurrent) < 2:
+        return [run_mcp_command(agent_name, command, gpt_response) for command in commands]
+
+    results: List[Optional[str]] = [None] * len(commands)
+    with ThreadPoolExecutor(max_workers=min(MAX_COMMAND_WORKERS, len(concurrent))) as executor:
+        futures: Dict[int, Future] = {
+            i: executor.submit(run_mcp_command, agent_name, commands[i], gpt_response)
+            for i in concurrent
+        }
+        for i, future in futures.items():
+            results[i] = future.result()
+
+    # The pool has drained; unsafe commands fill their own slots, keeping order.
+    for i, command in enumerate(commands):
+        if i not in futures:
+            results[i] = run_mcp_command(agent_name, command, gpt_response)
+    return results
+
+
+def _select_commands(agent_name: str, response: str) -> Tuple[str, ...]:
+    """
+    Commands selected by the response's leading word, longest first. The
+    index is built once per config version, replacing a scan of every command.
+    """
+    command_only = extract_command(response)
+    if not command_only:  # empty or whitespace-only response
+        return ()
 
-def process_mcp_commands(agent_name: str, gpt_response: str, initial_prompt: str) -> str:
+    leading_word_index = _get_derived(agent_name, "leading_word_index", _build_leading_word_index)
+    return leading_word_index.get(command_only.lower(), ())
+
+
+def process_mcp_commands(agent_name: str, gpt_response: str, initial_prompt: str,
+                         matched_command: Optional[MatchedCommand] = None) -> str:
     """
     Finds MCP commands in the GPT response, executes them, and formats a new prompt.
 
@@ -195,42 +543,33 @@ def process_mcp_commands(agent_name: str, gpt_response: str, initial_prompt: str
         agent_name: The name of the agent to process commands for.
         gpt_response: The raw response from the GPT model.
         initial_prompt: The original user query that started the interaction.
+        matched_command: The result of :func:`contains_mcp_command` for this
+            response, if the caller has it; its commands are run as selected.
 
     Returns:
         A new prompt string containing the command results, instructing the AI
         to use them to answer the initial query.
     """
-    
-    command_data = get_tools_and_data_mcp_commands_config(agent_name)
-    if not command_data:
-        logger.warning(f"No command data found for agent {agent_name}")
-        return gpt_response
-
-    # Get all defined command system_texts where the command is enabled
-    all_commands = [
-        cmd["system_text"]
-        for cmd in command_data.get("mcp_commands", [])
-        if cmd.get("enabled") and "system_text" in cmd
-    ]
+    if matched_command is not None:
+        all_commands = matched_command.commands
+    else:
+        command_data = _get_commands_config(agent_name)
+        if not command_data:
+            logger.warning("No command data found for agent %s", agent_name)
+            return gpt_response
 
-    # Sort by length descending to match longer commands first
-    all_commands.sort(key=len, reverse=True)
+        all_commands = _select_commands(agent_name, gpt_response)
 
     executed_results = []
     found_commands = False
 
-    # Iterate through commands and execute if found in the response
-    command_only = extract_command(gpt_response) # Work on a copy
-    for command in all_commands:
-        # Use case-insensitive check but execute with original case
-        # Note: The space is added to ensure a full command match.
-        if command_only.lower() + " " in command.lower() + " ":
-            found_commands = True
-            
-            command_result = run_mcp_command(agent_name, command, gpt_response)
-            executed_results.append(f"--- Command: {command} ---\nResult:\n{command_result}\n--- End {command} ---")
-            # Optional: Remove the command from temp_response to avoid re-matching parts?
-            # This is complex if commands overlap. Simpler to just list results.
+    # Execute the matched commands (with their original case), possibly concurrently
+    for command, command_result in zip(all_commands, _run_commands(agent_name, all_commands, gpt_response)):
+        found_commands = True
+
+        executed_results.append(f"--- Command: {command} ---\nResult:\n{command_result}\n--- End {command} ---")
+        # Optional: Remove the command from temp_response to avoid re-matching parts?
+        # This is complex if commands overlap. Simpler to just list results.
 
     if not found_commands:
          # Should not happen if called after contains_command, but handle defensively
@@ -0,0 +1,88 @@
+"""
+directory_reader.py
+===================
+
+Directory aggregation shared by the fileio commands: list the files with
+matching extensions, read them on a thread pool, and reuse the combined
+result while none of those files has changed.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Upper bound on reader threads; the work is mostly waiting on file I/O.
+MAX_READ_WORKERS = 32
+
+# Sorted (name, st_mtime_ns, st_size) of a directory's matching files.
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+# Last result per (command, directory, extensions), reused while the
+# directory's fingerprint is unchanged.
+_AGGREGATE_CACHE: Dict[Tuple[str, str, frozenset], Tuple[Fingerprint, str]] = {}
+
+
+def list_files(directory: Path, extensions: frozenset) -> Tuple[List[Path], Fingerprint]:
+    """
+    Files in *directory* whose suffix is in *extensions*, plus their fingerprint.
+
+    scandir's DirEntry answers is_file() from the directory listing where the
+    platform reports entry types, so only matching files are stat'ed.
+    """
+    files: List[Path] = []
+    fingerprint: List[Tuple[str, int, int]] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1] in extensions and entry.is_file():
+                st = entry.stat()
+                files.append(Path(entry.path))
+                fingerprint.append((entry.name, st.st_mtime_ns, st.st_size))
+    return files, tuple(sorted(fingerprint))
+
+
+def aggregate_directory(
+    command: str,
+    file_path: Optional[str],
+    extensions: frozenset,
+    read_one: Callable[[Path], Any],
+    combine: Callable[[List[Path], List[Any]], str],
+    sort_files: bool = False,
+) -> str:
+    """
+    Return ``combine(files, contents)`` for the matching files in *file_path*.
+
+    :param command: Name of the calling command, so each caches its own output.
+    :param file_path: Directory to read.
+    :param extensions: File suffixes to include, e.g. ``frozenset({'.md'})``.
+    :param read_one: Reads one file; runs on the thread pool.
+    :param combine: Builds the result from the files and their contents, in the same order.
+    :param sort_files: Read files in name order instead of directory order.
+    :return: The combined text, possibly from the cache.
+    """
+    if not file_path:
+        raise ValueError("Missing required 'file_path' in command_parameters.")
+
+    directory = Path(file_path)
+    if not directory.is_dir():
+        raise NotADirectoryError(f"'{file_path}' is not a valid directory.")
+
+    files, fingerprint = list_files(directory, extensions)
+    cache_key = (command, str(directory), extensions)
+    cached = _AGGREGATE_CACHE.get(cache_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    if sort_files:
+        files.sort()
+
+    # Read concurrently; map() keeps the contents in file order.
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(files))) as executor:
+            contents = list(executor.map(read_one, files))
+    else:
+        contents = [read_one(file) for file in files]
+
+    combined = combine(files, contents)
+    _AGGREGATE_CACHE[cache_key] = (fingerprint, combined)
+    return combined
@@ -1,11 +1,12 @@
 # timely/list_future_tasks.py
 
+from pathlib import Path
 from typing import Any, Dict
 
 def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[str, Any]) -> str:
     filename = command_parameters.get("filename")
 
-    with open(filename, "r", encoding="utf-8") as file:
-        contents = file.read()
+    # Read raw bytes and decode once; skips the text-mode wrapper's incremental decoding.
+    contents = Path(filename).read_bytes().decode("utf-8")
 
     return contents
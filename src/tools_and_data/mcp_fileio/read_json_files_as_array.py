@@ -2,6 +2,29 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+import orjson
+
+from src.tools_and_data.mcp_fileio.directory_reader import aggregate_directory
+
+
+def _load_one(file: Path) -> Any:
+    try:
+        # orjson parses the raw bytes directly (and validates UTF-8 itself).
+        return orjson.loads(file.read_bytes())
+    except (json.JSONDecodeError, OSError) as e:  # orjson.JSONDecodeError subclasses it
+        raise RuntimeError(f"Error reading or parsing '{file}': {e}")
+
+
+def _combine(files: List[Path], contents: List[Any]) -> str:
+    combined_items: List[Any] = []
+    for content in contents:
+        if isinstance(content, list):
+            combined_items.extend(content)
+        else:
+            combined_items.append(content)
+
+    return orjson.dumps(combined_items, option=orjson.OPT_INDENT_2).decode()
+
 
 def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[str, Any]) -> str:
     """
@@ -13,29 +36,10 @@ def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[st
     :param internal_params: Dictionary of internal parameters (unused here).
     :return: A JSON array string combining all parsed file contents.
     """
-    file_path = command_parameters.get("file_path")
-    extension_list = command_parameters.get("extension_list", ['.json'])
-
-    if not file_path:
-        raise ValueError("Missing required 'file_path' in command_parameters.")
-
-    directory = Path(file_path)
-    if not directory.is_dir():
-        raise NotADirectoryError(f"'{file_path}' is not a valid directory.")
-
-    combined_items: List[Any] = []
-
-    for file in directory.iterdir():
-        if file.suffix in extension_list and file.is_file():
-            try:
-                with file.open("r", encoding="utf-8") as f:
-                    content = json.load(f)
-                    if isinstance(content, list):
-                        combined_items.extend(content)
-                    else:
-                        combined_items.append(content)
-            except (json.JSONDecodeError, OSError) as e:
-                raise RuntimeError(f"Error reading or parsing '{file}': {e}")
-
-    json_array_text = json.dumps(combined_items, indent=2)
-    return json_array_text
\ No newline at end of file
+    return aggregate_directory(
+        "read_json_files_as_array",
+        command_parameters.get("file_path"),
+        frozenset(command_parameters.get("extension_list", ['.json'])),
+        _load_one,
+        _combine,
+    )
@@ -1,5 +1,24 @@
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+from src.tools_and_data.mcp_fileio.directory_reader import aggregate_directory
+
+
+def _read_one(file: Path) -> str:
+    try:
+        return file.read_bytes().decode("utf-8")
+    except OSError as e:
+        raise RuntimeError(f"Error reading '{file}': {e}")
+
+
+def _combine(files: List[Path], contents: List[str]) -> str:
+    parts: List[str] = [
+        f"\n<!-- Begin: {file.name} -->\n{file_content}\n<!-- End: {file.name} -->\n"
+        for file, file_content in zip(files, contents)
+    ]
+
+    # One join instead of repeated += keeps this linear in the total size.
+    return "".join(parts).strip()
 
 
 def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[str, Any]) -> str:
@@ -13,25 +32,11 @@ def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[st
     :param internal_params: Dictionary of internal parameters (unused here).
     :return: A single string with concatenated contents of all Markdown files.
     """
-    file_path = command_parameters.get("file_path")
-    extension_list = command_parameters.get("extension_list", ['.md'])
-
-    if not file_path:
-        raise ValueError("Missing required 'file_path' in command_parameters.")
-
-    directory = Path(file_path)
-    if not directory.is_dir():
-        raise NotADirectoryError(f"'{file_path}' is not a valid directory.")
-
-    combined_content = ""
-
-    for file in sorted(directory.iterdir()):
-        if file.suffix in extension_list and file.is_file():
-            try:
-                with file.open("r", encoding="utf-8") as f:
-                    file_content = f.read()
-                    combined_content += f"\n<!-- Begin: {file.name} -->\n{file_content}\n<!-- End: {file.name} -->\n"
-            except OSError as e:
-                raise RuntimeError(f"Error reading '{file}': {e}")
-
-    return combined_content.strip()
+    return aggregate_directory(
+        "read_markdown_files",
+        command_parameters.get("file_path"),
+        frozenset(command_parameters.get("extension_list", ['.md'])),
+        _read_one,
+        _combine,
+        sort_files=True,
+    )
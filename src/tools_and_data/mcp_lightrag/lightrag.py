@@ -1,11 +1,47 @@
 """
 Simple implementation of LightRAG class for local document retrieval
 """
+import gzip
 import os
-import json
+import pickle
+import re
+import numpy as np
+import orjson
 from typing import List, Dict, Any, Optional
 import hashlib
 
+try:
+    from numba import njit
+except ImportError:  # optional: np.bincount is used instead
+    njit = None
+
+# Runs of ASCII word characters or UTF-8 multi-byte sequences; ASCII
+# whitespace and punctuation separate tokens.
+_TOKEN = re.compile(rb"[A-Za-z0-9_\x80-\xff]+")
+
+
+def _doc_id(file_path: str) -> int:
+    """Stable 64-bit integer id for a document path (keys only, not security)."""
+    return int.from_bytes(hashlib.blake2b(file_path.encode(), digest_size=8).digest(), 'big')
+
+
+def _bincount_scores(postings: np.ndarray, n_docs: int) -> np.ndarray:
+    """Count how often each document position occurs in the concatenated postings."""
+    return np.bincount(postings, minlength=n_docs)
+
+
+def _loop_scores(postings: np.ndarray, n_docs: int) -> np.ndarray:
+    """Same count as _bincount_scores, written as the loop numba compiles."""
+    # Serial on purpose: a prange over scatter increments would race
+    scores = np.zeros(n_docs, np.int64)
+    for i in range(postings.shape[0]):
+        scores[postings[i]] += 1
+    return scores
+
+
+_score_postings = njit(cache=True)(_loop_scores) if njit is not None else _bincount_scores
+
+
 class LightRAG:
     """A lightweight RAG (Retrieval Augmented Generation) implementation for local files."""
     
@@ -26,37 +62,100 @@ class LightRAG:
             directory: Directory path to index files from
             file_extensions: List of file extensions to include
         """
+        previous = self._previous_documents()
+        previous_words = None
         self.documents = []
+        doc_words = []
         for root, _, files in os.walk(directory):
             for file in files:
                 if any(file.endswith(ext) for ext in file_extensions):
                     file_path = os.path.join(root, file)
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            doc_id = hashlib.md5(file_path.encode()).hexdigest()
-                            self.documents.append({
-                                "id": doc_id,
-                                "path": file_path,
-                                "content": content,
-                                "title": os.path.basename(file_path)
-                            })
+                        st = os.stat(file_path)
+                        old = previous.get(file_path)
+                        if old is not None and old.get("mtime_ns") == st.st_mtime_ns and old.get("size") == st.st_size:
+                            # Unchanged since the last build: reuse its postings
+                            if previous_words is None:
+                                previous_words = self._words_by_doc(list(previous.values()))
+                            words = previous_words.get(old["id"], set())
+                        else:
+                            words = self._read_words(file_path)
                     except Exception as e:
                         print(f"Error reading {file_path}: {e}")
+                        continue
+                    doc_id = _doc_id(file_path)
+                    # Content is read back from path at query time, only for the hits
+                    self.documents.append({
+                        "id": doc_id,
+                        "path": file_path,
+                        "title": os.path.basename(file_path),
+                        "mtime_ns": st.st_mtime_ns,
+                        "size": st.st_size
+                    })
+                    doc_words.append((doc_id, words))
         
         # Create a simple keyword index
-        self._build_index()
+        self._build_index(doc_words)
     
-    def _build_index(self) -> None:
-        """Build a simple keyword-based index."""
-        self.index = {}
-        for doc in self.documents:
-            content = doc["content"].lower()
-            words = set(content.split())
+    def _previous_documents(self) -> Dict[str, Dict[str, Any]]:
+        """Map path to document for the last build, loading the saved index if none is in memory."""
+        if not self.documents and os.path.exists(f"{self.name}.lrag"):
+            self.load_index(f"{self.name}.lrag")
+        return {doc["path"]: doc for doc in self.documents}
+    
+    def _words_by_doc(self, documents: List[Dict[str, Any]]) -> Dict[Any, set]:
+        """Invert the current index, built over documents, back into each document's word set."""
+        doc_ids = [doc["id"] for doc in documents]
+        words_by_doc = {}
+        for word, positions in self.index.items():
+            for position in positions.tolist():
+                words_by_doc.setdefault(doc_ids[position], set()).add(word)
+        return words_by_doc
+    
+    @staticmethod
+    def _read_words(file_path: str) -> set:
+        """Collect the distinct lower-cased words of a file, a line at a time."""
+        tokens = set()
+        with open(file_path, 'rb') as f:
+            for line in f:
+                tokens.update(_TOKEN.findall(line))
+        # Decode and fold only the distinct tokens, not the whole file
+        return {token.decode('utf-8', 'replace').lower() for token in tokens}
+    
+    def _build_index(self, doc_words: List[tuple]) -> None:
+        """Build a simple keyword-based index.
+        
+        Postings are sorted int32 arrays of positions in self.documents.
+        
+        Args:
+            doc_words: (document id, set of words) pairs in document order
+        """
+        postings = {}
+        for position, (_, words) in enumerate(doc_words):
             for word in words:
-                if word not in self.index:
-                    self.index[word] = []
-                self.index[word].append(doc["id"])
+                if word not in postings:
+                    postings[word] = []
+                postings[word].append(position)
+        self.index = {word: np.array(positions, dtype=np.int32) for word, positions in postings.items()}
+    
+    def _postings_as_arrays(self) -> None:
+        """Convert id-list postings from an older saved index into position arrays."""
+        position_of = {doc["id"]: position for position, doc in enumerate(self.documents)}
+        self.index = {
+            word: np.array(sorted(position_of[doc_id] for doc_id in doc_ids if doc_id in position_of), dtype=np.int32)
+            for word, doc_ids in self.index.items()
+        }
+    
+    def _with_content(self, doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a copy of doc with its content, reading the file if the index did not store it."""
+        if "content" in doc:
+            return doc
+        try:
+            with open(doc["path"], 'r', encoding='utf-8') as f:
+                return {**doc, "content": f.read()}
+        except Exception as e:
+            print(f"Error reading {doc['path']}: {e}")
+            return None
     
     def save_index(self, filename: str) -> None:
         """Save the index to a file.
@@ -64,12 +163,13 @@ class LightRAG:
         Args:
             filename: Name of the file to save the index to
         """
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump({
+        # Level 1 gzip: most of the size win for little CPU
+        with gzip.open(filename, 'wb', compresslevel=1) as f:
+            pickle.dump({
                 "name": self.name,
                 "documents": self.documents,
                 "index": self.index
-            }, f)
+            }, f, protocol=5)
     
     def load_index(self, filename: str) -> None:
         """Load an index from a file.
@@ -78,11 +178,20 @@ class LightRAG:
             filename: Name of the file to load the index from
         """
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                raw = f.read()
+                if raw[:2] == b'\x1f\x8b':
+                    raw = gzip.decompress(raw)
+                try:
+                    data = pickle.loads(raw)
+                except pickle.UnpicklingError:
+                    # Indexes written before the switch to pickle are JSON
+                    data = orjson.loads(raw)
                 self.name = data.get("name", self.name)
                 self.documents = data.get("documents", [])
                 self.index = data.get("index", {})
+                if any(not isinstance(postings, np.ndarray) for postings in self.index.values()):
+                    self._postings_as_arrays()
         except FileNotFoundError:
             print(f"Index file {filename} not found. Creating a new index.")
     
@@ -96,25 +205,27 @@ class LightRAG:
         Returns:
             List of document dictionaries
         """
-        query_words = query.lower().split()
-        doc_scores = {}
+        # Each distinct word counts once; single characters are dropped unless they are all there is
+        query_words = {token.decode('utf-8').lower() for token in _TOKEN.findall(query.encode('utf-8'))}
+        query_words = {word for word in query_words if len(word) > 1} or query_words
+        hits = [self.index[word] for word in query_words if word in self.index]
+        if not hits:
+            return []
         
-        for word in query_words:
-            if word in self.index:
-                for doc_id in self.index[word]:
-                    if doc_id not in doc_scores:
-                        doc_scores[doc_id] = 0
-                    doc_scores[doc_id] += 1
+        # One count per matching query word; postings hold a document at most once
+        scores = _score_postings(np.concatenate(hits), len(self.documents))
+        k = min(top_k, int(np.count_nonzero(scores)))
+        if k <= 0:
+            return []
         
-        # Sort by score
-        sorted_docs = sorted(doc_scores.items(), key=lambda x: x[1], reverse=True)
+        # Partial selection of the k best, then order them by score (ties by document order)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
         
-        # Get top-k documents
+        # Get top-k documents, loading content for just these
         results = []
-        for doc_id, _ in sorted_docs[:top_k]:
-            for doc in self.documents:
-                if doc["id"] == doc_id:
-                    results.append(doc)
-                    break
-        
+        for position in top.tolist():
+            doc = self._with_content(self.documents[position])
+            if doc is not None:
+                results.append(doc)
         return results
@@ -1,12 +1,12 @@
 # timely/list_future_tasks.py
 
 from typing import Any, Dict
-import requests
-import json
+import orjson
 import os
-import pathlib
 from datetime import date, timedelta
 
+from src.tools_and_data.mcp_timely.timely_cache import cached_get
+
 
 def extract_summary(forecasts: list) -> list:
     """
@@ -60,34 +60,9 @@ def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[st
         "Cookie": ""
     }
 
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    forecasts = response.json()
-
-    # Cache the response if forecasts were returned
-    if len(forecasts) > 0:
-        # Ensure cache directory exists
-        cache_dir = pathlib.Path('mcp_commands/timeely/cache')
-        cache_dir.mkdir(exist_ok=True)
-        
-        # Write the response to the cache file
-        cache_file = cache_dir / 'list_tasks.json'
-        with open(cache_file, 'w') as f:
-            json.dump(forecasts, f, indent=2)
-    else:
-        # Read forecasts from cache if API returned no results
-        cache_file = pathlib.Path('mcp_commands/timeely/cache/list_tasks.json')
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    forecasts = json.load(f)
-            except json.JSONDecodeError:
-                # If cache file is corrupted, return empty list
-                forecasts = []
-        else:
-            # If cache file doesn't exist, return empty list
-            forecasts = []
+    # An empty response is answered from the last non-empty one cached on disk
+    forecasts = cached_get(url, headers, stale_if_empty=True)
 
     summary = extract_summary(forecasts)
 
-    return json.dumps(summary, indent=2)
+    return orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode()
@@ -1,10 +1,20 @@
 # timely/list_projects.py
 
-from typing import Any, Dict
-import requests
-import json
+from typing import Any, Dict, Optional
+import orjson
 import os
-import pathlib
+
+from src.tools_and_data.mcp_timely.timely_cache import cached_get
+
+
+def _infer_budget_scope(name: str) -> Optional[str]:
+    """Guess whether a project budget is weekly or monthly from its name."""
+    name_lower = name.lower()
+    if "weekly" in name_lower:
+        return "weekly"
+    if "monthly" in name_lower:
+        return "monthly"
+    return None
 
 
 def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[str, Any]) -> str:
@@ -30,50 +40,11 @@ def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[st
         "Cookie": ""
     }
 
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    projects = response.json()
-
-       # Cache the response if projects were returned
-    if len(projects) > 0:
-        # Ensure cache directory exists
-        cache_dir = pathlib.Path('mcp_commands/timeely/cache')
-        cache_dir.mkdir(exist_ok=True)
-        
-        # Write the response to the cache file
-        cache_file = cache_dir / 'list_projects.json'
-        with open(cache_file, 'w') as f:
-            json.dump(projects, f, indent=2)
-
-    else:
-        # Read projects from cache if API returned no results
-        cache_file = pathlib.Path('mcp_commands/timeely/cache/list_projects.json')
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    projects = json.load(f)
-            except json.JSONDecodeError:
-                # If cache file is corrupted, return empty list
-                projects = []
-        else:
-            # If cache file doesn't exist, return empty list
-            projects = []
-
-    simplified = []
-
-    for project in projects:
-        if not project.get("active", True):
-            continue
-
-        name_lower = project.get("name", "").lower()
-        if "weekly" in name_lower:
-            inferred_scope = "weekly"
-        elif "monthly" in name_lower:
-            inferred_scope = "monthly"
-        else:
-            inferred_scope = None
+    # An empty response is answered from the last non-empty one cached on disk
+    projects = cached_get(url, headers, stale_if_empty=True)
 
-        simplified.append({
+    simplified = [
+        {
             "id": project["id"],
             "name": project["name"],
             "description": project.get("description"),
@@ -81,7 +52,10 @@ def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[st
             "budget_type": project.get("budget_type"),
             "has_recurrences": project.get("has_recurrences"),
             "budget_calculation": project.get("budget_calculation"),
-            "inferred_budget_scope": inferred_scope
-        })
+            "inferred_budget_scope": _infer_budget_scope(project.get("name", ""))
+        }
+        for project in projects
+        if project.get("active", True)
+    ]
     
-    return json.dumps(simplified, indent=2)
+    return orjson.dumps(simplified, option=orjson.OPT_INDENT_2).decode()
@@ -1,33 +1,38 @@
 # timely/project_hours.py
 
 from typing import Any, Dict, List
-import requests
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta, datetime
 import calendar
+import functools
+
+from src.tools_and_data.mcp_timely.timely_cache import cached_get
 
 
 def format_date_range(start: date, end: date) -> str:
     return f"from={start.isoformat()}&to={end.isoformat()}"
 
 
-def get_timeframes() -> Dict[str, str]:
-    today = date.today()
-    yesterday = today - timedelta(days=1)
+def first_day_of_month(d: date) -> date: return d.replace(day=1)
+def last_day_of_month(d: date) -> date: return d.replace(day=calendar.monthrange(d.year, d.month)[1])
 
-    def first_day_of_month(d): return d.replace(day=1)
-    def last_day_of_month(d): return d.replace(day=calendar.monthrange(d.year, d.month)[1])
+def first_day_of_quarter(d: date) -> date:
+    return date(d.year, 3 * ((d.month - 1) // 3) + 1, 1)
 
-    def first_day_of_quarter(d):
-        return date(d.year, 3 * ((d.month - 1) // 3) + 1, 1)
+def last_day_of_quarter(d: date) -> date:
+    start = first_day_of_quarter(d)
+    month = start.month + 2
+    return date(d.year, month, calendar.monthrange(d.year, month)[1])
 
-    def last_day_of_quarter(d):
-        start = first_day_of_quarter(d)
-        month = start.month + 2
-        return date(d.year, month, calendar.monthrange(d.year, month)[1])
+def first_day_of_year(d: date) -> date: return date(d.year, 1, 1)
+def last_day_of_year(d: date) -> date: return date(d.year, 12, 31)
 
-    def first_day_of_year(d): return date(d.year, 1, 1)
-    def last_day_of_year(d): return date(d.year, 12, 31)
+
+@functools.lru_cache(maxsize=1)
+def _timeframes_for(day_ordinal: int) -> Dict[str, str]:
+    today = date.fromordinal(day_ordinal)
+    yesterday = today - timedelta(days=1)
 
     last_week_start = today - timedelta(days=today.weekday() + 7)
     last_week_end = last_week_start + timedelta(days=6)
@@ -49,6 +54,11 @@ def get_timeframes() -> Dict[str, str]:
         "last_year": format_date_range(first_day_of_year(today.replace(year=today.year - 1)), last_day_of_year(today.replace(year=today.year - 1))),
     }
 
+
+def get_timeframes() -> Dict[str, str]:
+    # Pure function of the calendar day, so memoise on today's ordinal
+    return dict(_timeframes_for(date.today().toordinal()))
+
 def extract_project_summary(events: list) -> dict:
     """
     Aggregates total minutes by project and returns a summary dictionary keyed by project_id.
@@ -59,30 +69,34 @@ def extract_project_summary(events: list) -> dict:
     summary = {}
 
     for entry in events:
-        project = entry.get("project")
-        if not project:
-            continue
+        _accumulate(summary, entry)
 
-        project_id = project.get("id")
-        if not project_id:
-            continue
+    return summary
 
-        duration = entry.get("duration", {})
-        minutes = duration.get("total_minutes", 0)
+def _accumulate(summary: dict, entry: dict) -> None:
+    """Fold one Timely event into a project summary in place."""
+    project = entry.get("project")
+    if not project:
+        return
 
-        if project_id not in summary:
-            summary[project_id] = {
-                "project_id": project_id,
-                "project_name": project.get("name"),
-                "budget": project.get("budget"),
-                "budget_type": project.get("budget_type"),
-                "budget_progress": project.get("budget_progress"),
-                "total_minutes": 0
-            }
+    project_id = project.get("id")
+    if not project_id:
+        return
 
-        summary[project_id]["total_minutes"] += minutes
+    duration = entry.get("duration", {})
+    minutes = duration.get("total_minutes", 0)
 
-    return summary
+    if project_id not in summary:
+        summary[project_id] = {
+            "project_id": project_id,
+            "project_name": project.get("name"),
+            "budget": project.get("budget"),
+            "budget_type": project.get("budget_type"),
+            "budget_progress": project.get("budget_progress"),
+            "total_minutes": 0
+        }
+
+    summary[project_id]["total_minutes"] += minutes
 
 def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[str, Any]) -> str:
     access_token = internal_params["access_token"]
@@ -99,29 +113,27 @@ def execute_command(command_parameters: Dict[str, Any], internal_params: Dict[st
     }
 
     timeframes = get_timeframes()
-    results = {}
-
+    urls = []
     for label, date_range in timeframes.items():
         url = f"https://api.timelyapp.com/1.1/{account_id}/events?{date_range}"
         if user_id:
             url += f"&user_ids[]={user_id}"
+        urls.append((label, url))
 
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-
-        data = response.json()
-
-        json_string = json.dumps(data, indent=2)
-
-        print("")
-        print("")
-        print("")
-
-        print(json_string)
-
-        # Extract project name and hours
-        results[label] = [
-           extract_project_summary(data)
+    # The timeframes are independent, so fetch them concurrently over the
+    # shared Timely session; results stay in timeframe order. Each worker
+    # folds its events into a per-project summary, and only that is cached,
+    # so the raw event lists are released as soon as they are parsed.
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        futures = [
+            (label, executor.submit(cached_get, url, headers, reduce=extract_project_summary))
+            for label, url in urls
         ]
 
-    return json.dumps(results, indent=2)
+        for label, future in futures:
+            # Extract project name and hours
+            results[label] = future.result()
+
+    # Summaries are keyed by numeric project id; json.dumps stringified those keys too
+    return orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
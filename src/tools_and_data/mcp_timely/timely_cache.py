@@ -0,0 +1,118 @@
+# timely/timely_cache.py
+
+import gzip
+import hashlib
+import os
+import pathlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Anchored to this package rather than the working directory; TIMELY_CACHE_DIR overrides it.
+CACHE_DIR = pathlib.Path(os.getenv(
+    "TIMELY_CACHE_DIR",
+    pathlib.Path(__file__).resolve().parent / "mcp_commands" / "timeely" / "cache" / "http",
+))
+DEFAULT_TTL = 300
+MEMORY_CACHE_SIZE = 128
+
+# One keep-alive pool to api.timelyapp.com shared by every Timely command;
+# transient gateway errors on GETs are retried with backoff.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
+# url -> (expires_at, parsed body); insertion order doubles as LRU order.
+_MEMORY_CACHE: Dict[str, Tuple[float, Any]] = {}
+_MEMORY_LOCK = threading.Lock()
+
+
+def _memory_get(url: str) -> Optional[Any]:
+    with _MEMORY_LOCK:
+        entry = _MEMORY_CACHE.pop(url, None)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        _MEMORY_CACHE[url] = entry
+        return entry[1]
+
+
+def _memory_put(url: str, data: Any, ttl: float) -> None:
+    with _MEMORY_LOCK:
+        _MEMORY_CACHE.pop(url, None)
+        _MEMORY_CACHE[url] = (time.monotonic() + ttl, data)
+        while len(_MEMORY_CACHE) > MEMORY_CACHE_SIZE:
+            del _MEMORY_CACHE[next(iter(_MEMORY_CACHE))]
+
+
+def cached_get(url: str, headers: Dict[str, str], ttl: float = DEFAULT_TTL,
+               reduce: Optional[Callable[[Any], Any]] = None,
+               stale_if_empty: bool = False) -> Any:
+    """
+    GET a Timely endpoint and return the parsed JSON body, caching it for ttl seconds.
+
+    Hits are served from memory first, then from a gzip'd file under CACHE_DIR
+    whose mtime is younger than ttl. The URL already carries the account id, so it is
+    the cache key. With reduce, only its result is cached, so large payloads
+    are dropped as soon as they have been folded.
+
+    With stale_if_empty, an empty response never overwrites the cache file, so
+    that file always holds the last non-empty body, and a fresh empty response
+    is answered from it whatever its age.
+
+    The returned object is shared with every other caller of the same URL
+    until it expires, so callers must not mutate it.
+
+    :param url: Fully qualified Timely API URL.
+    :param headers: Request headers.
+    :param ttl: Freshness window in seconds.
+    :param reduce: Optional function applied to the parsed body before caching.
+    :param stale_if_empty: Fall back to the last non-empty body when the API returns none.
+    :return: Parsed JSON response, or reduce(response).
+    """
+    key = url if reduce is None else f"{url}#{reduce.__module__}.{reduce.__qualname__}"
+    data = _memory_get(key)
+    if data is not None:
+        return data
+
+    cache_file = CACHE_DIR / (hashlib.sha1(key.encode()).hexdigest() + '.json.gz')
+    try:
+        age = time.time() - cache_file.stat().st_mtime
+        if age < ttl:
+            data = orjson.loads(gzip.decompress(cache_file.read_bytes()))
+            _memory_put(key, data, ttl - age)
+            return data
+    except (OSError, EOFError, orjson.JSONDecodeError):  # a truncated gzip raises EOFError
+        pass
+
+    response = _SESSION.get(url, headers=headers)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    if reduce is None:
+        body = response.content
+    else:
+        data = reduce(data)
+        body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    if stale_if_empty and not data:
+        try:
+            data = orjson.loads(gzip.decompress(cache_file.read_bytes()))
+        except (OSError, EOFError, orjson.JSONDecodeError):
+            pass  # nothing usable on disk; keep the empty body
+        _memory_put(key, data, ttl)
+        return data
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_file.write_bytes(gzip.compress(body, compresslevel=1))
+    os.replace(tmp_file, cache_file)
+    _memory_put(key, data, ttl)
+
+    return data
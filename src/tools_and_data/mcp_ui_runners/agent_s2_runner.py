@@ -16,13 +16,35 @@ Assumptions
 """
 from __future__ import annotations
 
-import json
+import asyncio
 import os
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.tools_and_data.mcp_ui_runners import result_cache
 
 ENDPOINT: str = os.getenv("AGENT_S2_ENDPOINT", "http://localhost:8080/execute")
+MAX_BATCH_WORKERS: int = 8
+
+# Keep-alive session reused across tasks. Retry only covers connection
+# failures here: urllib3 does not re-send a POST after the server answered.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Shared, bounded pool for execute_batch / execute_command_async.
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS, thread_name_prefix="agent-s2")
 
 
 def execute_command(
@@ -35,7 +57,8 @@ def execute_command(
     Parameters
     ----------
     command_parameters :
-        { "task": "...", "timeout": 300, ... }
+        { "task": "...", "timeout": 300, "cache_ttl": 0, ... }
+        ``cache_ttl`` (sec) opts a repeatable task into reusing a prior reply.
     internal_params :
         Arbitrary MCP metadata.
 
@@ -49,20 +72,63 @@ def execute_command(
         raise ValueError("`task` key is mandatory for Agent S2 execution.")
 
     timeout: int = int(command_parameters.get("timeout", 300))
+    cache_ttl: float = float(command_parameters.get("cache_ttl", 0))
 
-    response = requests.post(
-        ENDPOINT,
-        json={"task": task, "timeout": timeout},
-        timeout=timeout,
-    )
-    response.raise_for_status()
+    key = result_cache.cache_key(ENDPOINT, task, timeout)
+    cached = result_cache.lookup(key, cache_ttl) if cache_ttl > 0 else None
+    if cached is None:
+        response = _SESSION.post(
+            ENDPOINT,
+            data=orjson.dumps({"task": task, "timeout": timeout}),
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        cached = {
+            "tool_response": orjson.loads(response.content).get("result"),
+            "status_code": response.status_code,
+        }
+        if cache_ttl > 0:
+            result_cache.store(key, cached)
 
-    return json.dumps(
+    return orjson.dumps(
         {
-            "tool_response": response.json().get("result"),
-            "status_code": response.status_code,
+            "tool_response": cached["tool_response"],
+            "status_code": cached["status_code"],
             "endpoint": ENDPOINT,
             "trace_id": internal_params.get("trace_id"),
         },
-        ensure_ascii=False,
+    ).decode()
+
+
+def execute_batch(
+    command_parameters_list: List[Dict[str, Any]],
+    internal_params: Dict[str, Any],
+) -> List[str]:
+    """
+    Run several tasks concurrently, one request per worker thread.
+
+    Returns
+    -------
+    list[str]
+        One ``execute_command`` result per entry, in input order.
+    """
+    return list(_EXECUTOR.map(
+        lambda command_parameters: execute_command(command_parameters, internal_params),
+        command_parameters_list,
+    ))
+
+
+async def execute_command_async(
+    command_parameters: Dict[str, Any],
+    internal_params: Dict[str, Any],
+) -> str:
+    """
+    Awaitable ``execute_command`` for asyncio callers.
+
+    The blocking HTTP request runs on the module's shared worker pool, so
+    the event loop keeps serving other work meanwhile.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _EXECUTOR, execute_command, command_parameters, internal_params
     )
@@ -17,17 +17,22 @@ Task schema (command_parameters)
 --------------------------------
 {
   "task": "Describe what you want done (string)",
-  "max_steps": 40             # optional
+  "max_steps": 40,            # optional
+  "cache_ttl": 0              # optional, sec; reuse a prior reply for repeatable tasks
 }
 """
 from __future__ import annotations
 
-import json
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
+import orjson
 from open_computer_agent import ComputerAgent  # type: ignore
 
+from src.tools_and_data.mcp_ui_runners import result_cache
+
 
 # --------------------------------------------------------------------------- #
 # Globals
@@ -35,6 +40,10 @@ from open_computer_agent import ComputerAgent  # type: ignore
 _MODEL = os.getenv("OCAGENT_MODEL", "opencomputer/gpt-4o-mini-vision")
 _AGENT = ComputerAgent(model_name=_MODEL)
 
+# A single worker: every task drives the same agent and desktop, so tasks
+# queue here instead of overlapping.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="oca")
+
 
 # --------------------------------------------------------------------------- #
 # MCP entry-point
@@ -52,6 +61,7 @@ def execute_command(
         Keys:
             * ``task``      – required, natural-language instruction
             * ``max_steps`` – optional, int
+            * ``cache_ttl`` – optional, seconds to reuse a prior reply
     internal_params
         Context from MCP; echoed back for traceability.
 
@@ -65,12 +75,37 @@ def execute_command(
         raise ValueError("`task` is required for OCA runner.")
 
     max_steps: int = int(command_parameters.get("max_steps", 40))
+    cache_ttl: float = float(command_parameters.get("cache_ttl", 0))
 
-    response: str = _AGENT.run(task, max_steps=max_steps)
+    key = result_cache.cache_key(_MODEL, task, max_steps)
+    response: str | None = result_cache.lookup(key, cache_ttl) if cache_ttl > 0 else None
+    if response is None:
+        response = _AGENT.run(task, max_steps=max_steps)
+        if cache_ttl > 0:
+            result_cache.store(key, response)
 
     result: Dict[str, Any] = {
         "tool_response": response,
         "model": _MODEL,
         "request_id": internal_params.get("request_id"),
     }
-    return json.dumps(result, ensure_ascii=False)
+    return orjson.dumps(result).decode()
+
+
+# --------------------------------------------------------------------------- #
+# Async entry-point
+# --------------------------------------------------------------------------- #
+async def execute_command_async(
+    command_parameters: Dict[str, Any],
+    internal_params: Dict[str, Any],
+) -> str:
+    """
+    Awaitable ``execute_command`` for asyncio callers.
+
+    The blocking agent run runs on the module's shared worker pool, so
+    the event loop keeps serving other work meanwhile.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _EXECUTOR, execute_command, command_parameters, internal_params
+    )
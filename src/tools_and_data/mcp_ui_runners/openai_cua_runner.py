@@ -17,11 +17,15 @@ Example
 """
 from __future__ import annotations
 
-import json
+import asyncio
 import os
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 
 import openai
+import orjson
+
+from src.tools_and_data.mcp_ui_runners import result_cache
 
 
 # --------------------------------------------------------------------------- #
@@ -29,6 +33,10 @@ import openai
 # --------------------------------------------------------------------------- #
 openai.api_key = os.environ["OPENAI_API_KEY"]
 MODEL_NAME: str = os.getenv("OPENAI_CUA_MODEL", "gpt-4o-mini-cua")
+MAX_BATCH_WORKERS: int = 8
+
+# Shared, bounded pool for execute_batch / execute_command_async.
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS, thread_name_prefix="openai-cua")
 
 
 # --------------------------------------------------------------------------- #
@@ -47,10 +55,14 @@ def execute_command(
         Expected keys::
 
             {
-              "task"   : str,   # required – what you want done
-              "timeout": int    # optional – sec, default 180
+              "task"     : str,   # required – what you want done
+              "timeout"  : int,   # optional – sec, default 180
+              "cache_ttl": int    # optional – sec, reuse a prior reply
             }
 
+        Cached runs are issued at temperature 0 so the stored reply is
+        the one a repeat call would get.
+
     internal_params :
         Opaque values from the MCP runtime; passed through for tracing.
 
@@ -66,28 +78,79 @@ def execute_command(
         raise ValueError("`task` (str) is required in command_parameters.")
 
     timeout: int = int(command_parameters.get("timeout", 180))
+    cache_ttl: float = float(command_parameters.get("cache_ttl", 0))
+
+    # --- Cache ------------------------------------------------------------- #
+    key = result_cache.cache_key(MODEL_NAME, task)
+    content: str | None = result_cache.lookup(key, cache_ttl) if cache_ttl > 0 else None
 
     # --- LLM call ---------------------------------------------------------- #
-    completion = openai.ChatCompletion.create(
-        model=MODEL_NAME,
-        tools=[{"type": "computer_use"}],  # activates CUA
-        messages=[
-            {
-                "role": "system",
-                "content": (
-                    "You are an expert computer operator.  Complete the user's "
-                    "task exactly and stop when finished."
-                ),
-            },
-            {"role": "user", "content": task},
-        ],
-        timeout=timeout,
-    )
+    if content is None:
+        extra: Dict[str, Any] = {"temperature": 0} if cache_ttl > 0 else {}
+        completion = openai.ChatCompletion.create(
+            model=MODEL_NAME,
+            tools=[{"type": "computer_use"}],  # activates CUA
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "You are an expert computer operator.  Complete the user's "
+                        "task exactly and stop when finished."
+                    ),
+                },
+                {"role": "user", "content": task},
+            ],
+            timeout=timeout,
+            **extra,
+        )
+        content = completion.choices[0].message.content
+        if cache_ttl > 0:
+            result_cache.store(key, content)
 
     # --- Return ------------------------------------------------------------ #
     result: Dict[str, Any] = {
-        "tool_response": completion.choices[0].message.content,
+        "tool_response": content,
         "model": MODEL_NAME,
         "conversation_id": internal_params.get("conversation_id"),
     }
-    return json.dumps(result, ensure_ascii=False)
+    return orjson.dumps(result).decode()
+
+
+# --------------------------------------------------------------------------- #
+# Batch entry-point
+# --------------------------------------------------------------------------- #
+def execute_batch(
+    command_parameters_list: List[Dict[str, Any]],
+    internal_params: Dict[str, Any],
+) -> List[str]:
+    """
+    Run several tasks concurrently, one completion call per worker thread.
+
+    Returns
+    -------
+    list[str]
+        One ``execute_command`` result per entry, in input order.
+    """
+    return list(_EXECUTOR.map(
+        lambda command_parameters: execute_command(command_parameters, internal_params),
+        command_parameters_list,
+    ))
+
+
+# --------------------------------------------------------------------------- #
+# Async entry-point
+# --------------------------------------------------------------------------- #
+async def execute_command_async(
+    command_parameters: Dict[str, Any],
+    internal_params: Dict[str, Any],
+) -> str:
+    """
+    Awaitable ``execute_command`` for asyncio callers.
+
+    The blocking completion call runs on the module's shared worker pool, so
+    the event loop keeps serving other work meanwhile.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _EXECUTOR, execute_command, command_parameters, internal_params
+    )
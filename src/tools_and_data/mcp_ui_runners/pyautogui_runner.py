@@ -17,15 +17,15 @@ command_parameters = {
       {"type": "write", "text": "hello world", "interval": 0.05},
       {"type": "hotkey", "keys": ["ctrl", "s"]}
   ],
-  "pause": 0.3          # optional default pause between actions (sec)
+  "pause": 0.3          # optional pause between actions (sec), default 0
 }
 """
 from __future__ import annotations
 
-import json
 import time
 from typing import Any, Dict, List
 
+import orjson
 import pyautogui
 
 # Fail fast if user moves mouse to upper-left (emergency abort)
@@ -81,21 +81,28 @@ def execute_command(
     if not actions:
         raise ValueError("`actions` list is required.")
 
-    pause: float = float(command_parameters.get("pause", 0.3))
+    # PyAutoGUI already waits pyautogui.PAUSE after each call; extra sleep is opt-in.
+    pause: float = float(command_parameters.get("pause", 0.0))
 
-    start_ts: float = time.time()
-    for i, action in enumerate(actions, start=1):
-        handler = _ACTION_MAP.get(action["type"])
-        if handler is None:
-            raise ValueError(f"Unsupported action type: {action['type']}")
+    # Locals for the hot loop
+    dispatch = _ACTION_MAP
+    sleep = time.sleep
+
+    start_ts: float = time.perf_counter()
+    for action in actions:
+        action_type = action["type"]
+        try:
+            handler = dispatch[action_type]
+        except KeyError:
+            raise ValueError(f"Unsupported action type: {action_type}") from None
         handler(action)
-        time.sleep(pause)
+        if pause:
+            sleep(pause)
 
-    duration: float = round(time.time() - start_ts, 3)
-    return json.dumps(
+    duration: float = round(time.perf_counter() - start_ts, 3)
+    return orjson.dumps(
         {
             "tool_response": f"Executed {len(actions)} steps in {duration}s",
             "mcp_context": internal_params,
         },
-        ensure_ascii=False,
-    )
+    ).decode()
@@ -0,0 +1,48 @@
+"""
+result_cache.py
+===============
+
+Small on-disk TTL cache for runner tool responses.
+
+Runners only consult it when a task opts in with ``cache_ttl`` (seconds):
+these tools act on a real desktop, so replaying an old answer is only
+correct for tasks the caller knows to be read-only and repeatable.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pathlib
+import threading
+import time
+from typing import Any, Optional
+
+import orjson
+
+CACHE_DIR = pathlib.Path(os.getenv("MCP_RUNNER_CACHE_DIR", ".mcp_llm_cache"))
+
+
+def cache_key(*parts: Any) -> str:
+    """Digest the parts that determine a runner's answer into a file-safe key."""
+    raw = "\x1f".join(str(part) for part in parts).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def lookup(key: str, ttl: float) -> Optional[Any]:
+    """Return the cached value for key if it was stored less than ttl seconds ago."""
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def store(key: str, value: Any) -> None:
+    """Persist value under key, replacing any previous entry atomically."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CACHE_DIR / f"{key}.json"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(orjson.dumps(value))
+    os.replace(tmp, path)
@@ -28,10 +28,10 @@ Notes
 """
 from __future__ import annotations
 
-import json
 import os
 from typing import Any, Dict, List
 
+import orjson
 import rpa as tagui  # noqa: E402
 
 
@@ -70,12 +70,11 @@ def execute_command(
         tagui.close()
         status = f"error: {exc}"
 
-    return json.dumps(
+    return orjson.dumps(
         {
             "tool_response": status,
             "script_lines": len(script.splitlines()),
             "session_headless": headless,
             "run_id": internal_params.get("run_id"),
         },
-        ensure_ascii=False,
-    )
+    ).decode()
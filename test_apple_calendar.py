@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for the Apple Calendar MCP command helpers
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+# apple_calendar imports both from the project root (src.*) and from src (ras.*)
+ROOT_DIR = Path(__file__).resolve().parent
+for path in (ROOT_DIR, ROOT_DIR / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+@pytest.fixture
+def apple_calendar(tmp_path, monkeypatch):
+    """The apple_calendar module, with its import-time ~/ram_data dirs under tmp_path"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    from src.tools_and_data.mcp_calendar import apple_calendar
+    return apple_calendar
+
+@pytest.mark.parametrize("iso, expected", [
+    ("PT45M", timedelta(minutes=45)),
+    ("PT1H30M", timedelta(hours=1, minutes=30)),
+    ("P1D", timedelta(days=1)),
+    ("P2DT3H", timedelta(days=2, hours=3)),
+])
+def test_parse_duration(apple_calendar, iso, expected):
+    assert apple_calendar._parse_duration(iso) == expected
+
+@pytest.mark.parametrize("iso", ["P", "1D", "PT1X", "P1H"])
+def test_parse_duration_rejects_malformed(apple_calendar, iso):
+    with pytest.raises(ValueError):
+        apple_calendar._parse_duration(iso)
@@ -1,149 +1,335 @@
 #!/usr/bin/env python3
 """
 Test script to demonstrate the one-client-per-server MCP architecture
+
+Run it directly for the full report and benchmark, or with pytest for the
+pass/fail checks at the bottom of this file (fixtures live in conftest.py).
 """
 
 import asyncio
+import enum
+import json
+import os
 import sys
+import time
 from pathlib import Path
+from typing import NamedTuple
 
-# Add src to path
+# Add src to path (once, even if a larger harness imports this module repeatedly).
+# The ras/mcp_clients imports live inside the functions that use them, so importing
+# this file (e.g. during pytest collection) doesn't load the MCP SDK.
 SRC_DIR = Path(__file__).resolve().parent / "src"
-sys.path.insert(0, str(SRC_DIR))
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
 
-from ras.agent_config_buffer import load_agent_manifest
-from ras.mcp_client_manager import MCPClientManager
-from mcp_clients.mcp_python_sdk_2025_03_26.multi_server_client import MultiServerMCPClient
+# Fan-out used when the agent's server list isn't known from its config
+DEFAULT_CONCURRENT_CONNECTIONS = 8
 
-async def test_multi_server_client(agent_name: str):
-    """Test the new MultiServerMCPClient directly"""
-    print(f"=== Testing MultiServerMCPClient for agent '{agent_name}' ===")
+# Wall-clock ceilings so a hung MCP server subprocess can't block the run forever
+ADD_CLIENT_TIMEOUT = 15.0
+PHASE_TIMEOUT = 30.0
+
+# Fan-outs the benchmark sweeps, to find where adding connections stops helping
+BENCH_CONCURRENCY = (1, 2, 4, 8, 16)
+
+class ToolInfo(NamedTuple):
+    """A tool as reported by get_all_tools(), with attribute access instead of dict lookups"""
+    name: str
+    description: str
+
+def as_tool_infos(tools):
+    """Normalise get_all_tools() output to ToolInfo, accepting clients that still return dicts"""
+    return [tool if isinstance(tool, ToolInfo) else ToolInfo(tool['name'], tool['description']) for tool in tools]
+
+class PhaseResult(enum.Enum):
+    """Outcome of a test phase, so main() can tell failure kinds apart"""
+    OK = "ok"
+    TIMEOUT = "timeout"
+    CONFIG = "config"
+    IO = "io"
+
+# Failures a phase reports as a PhaseResult; anything else propagates with its traceback
+EXPECTED_ERRORS = (asyncio.TimeoutError, FileNotFoundError, json.JSONDecodeError, KeyError, ConnectionError, OSError)
+
+def classify_error(e: Exception) -> PhaseResult:
+    """Map one of EXPECTED_ERRORS onto a PhaseResult"""
+    # Checked first: on 3.11+ asyncio.TimeoutError is the builtin, an OSError subclass
+    if isinstance(e, asyncio.TimeoutError):
+        return PhaseResult.TIMEOUT
+    if isinstance(e, (FileNotFoundError, json.JSONDecodeError, KeyError)):
+        return PhaseResult.CONFIG
+    return PhaseResult.IO
+
+def emit(lines):
+    """Write a section's lines with one stdout write and flush, instead of a print per line"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+async def bounded(coro, label: str):
+    """Await coro under PHASE_TIMEOUT; a timeout is reported as PhaseResult.TIMEOUT"""
+    try:
+        return await asyncio.wait_for(coro, timeout=PHASE_TIMEOUT)
+    except asyncio.TimeoutError:
+        print(f"✗ {label} timed out after {PHASE_TIMEOUT:.0f}s")
+        return PhaseResult.TIMEOUT
+
+async def close_all(*cleanups):
+    """Await independent cleanup coroutines together; one failing doesn't skip the rest"""
+    results = await asyncio.gather(*cleanups, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Cleanup error: {type(result).__name__}: {result}")
+
+async def run_concurrently(*coros):
+    """Run independent coroutines together and return their results in order"""
+    if hasattr(asyncio, "TaskGroup"):  # Python 3.11+: structured concurrency and cancellation
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+        return [task.result() for task in tasks]
+    return await asyncio.gather(*coros)
+
+async def connect_client(agent_name: str, client):
+    """Connect client to all of the agent's servers at once; return (status, elapsed ns)"""
+    from ras.agent_config_buffer import get_agent_servers
     
-    client = MultiServerMCPClient(agent_name)
+    print(f"Connecting to servers for agent '{agent_name}' concurrently...")
+    concurrent_connections = len(get_agent_servers(agent_name)) or DEFAULT_CONCURRENT_CONNECTIONS
+    start_ns = time.perf_counter_ns()
+    
+    iter_connect = getattr(client, "iter_connect", None)
+    if iter_connect is None:
+        status = await client.connect_to_servers(concurrent_connections=concurrent_connections, timeout=10.0)
+    else:
+        # Report each server as it resolves instead of after the slowest one
+        status = {}
+        async for server_path, success in iter_connect(concurrent_connections=concurrent_connections, timeout=10.0):
+            status[server_path] = success
+            status_icon = "✓" if success else "✗"
+            print(f"  {status_icon} {server_path} ({(time.perf_counter_ns() - start_ns) / 1e6:.1f} ms)")
+    
+    return status, time.perf_counter_ns() - start_ns
+
+async def check_multi_server_client(agent_name: str, client, status):
+    """Test the new MultiServerMCPClient directly, on an already connected client"""
+    print(f"=== Testing MultiServerMCPClient for agent '{agent_name}' ===")
     
     try:
-        # Test concurrent connection to multiple servers
-        print("Connecting to servers concurrently...")
-        status = await client.connect_to_servers(concurrent_connections=3, timeout=5.0)
-        
-        print("\nConnection Results:")
+        lines = ["", "Connection Results:"]
         for server_path, success in status.items():
             status_icon = "✓" if success else "✗"
-            print(f"  {status_icon} {server_path}")
+            lines.append(f"  {status_icon} {server_path}")
         
         # Show all available tools
-        tools = client.get_all_tools()
-        print(f"\nTotal tools available: {len(tools)}")
+        tools = as_tool_infos(client.get_all_tools())
+        lines.append(f"\nTotal tools available: {len(tools)}")
         for tool in tools:
-            print(f"  - {tool['name']}: {tool['description']}")
+            lines.append(f"  - {tool.name}: {tool.description}")
         
-        # Test tool routing
-        print(f"\nTool routing test:")
-        for tool in tools[:3]:  # Test first 3 tools
-            tool_name = tool['name']
-            client_for_tool = client.find_client_for_tool(tool_name)
+        # Test tool routing: resolve every tool once, then report from the table
+        lines.append(f"\nTool routing test:")
+        tool_index = {tool.name: client.find_client_for_tool(tool.name) for tool in tools}
+        unrouted = [tool_name for tool_name, client_for_tool in tool_index.items() if client_for_tool is None]
+        lines.append(f"  {len(tool_index) - len(unrouted)}/{len(tool_index)} tools routed")
+        for tool_name, client_for_tool in list(tool_index.items())[:3]:  # Show first 3 tools
             if client_for_tool:
-                print(f"  Tool '{tool_name}' -> {client_for_tool.module_path}")
+                lines.append(f"  Tool '{tool_name}' -> {client_for_tool.module_path}")
+        for tool_name in unrouted:
+            lines.append(f"  ✗ Tool '{tool_name}' has no server")
+        emit(lines)
         
-        return True
+        return PhaseResult.OK
         
+    except EXPECTED_ERRORS as e:
+        result = classify_error(e)
+        print(f"Error ({result.value}): {type(e).__name__}: {e}")
+        return result
     except Exception as e:
-        print(f"Error: {str(e)}")
-        return False
-    finally:
-        await client.cleanup()
+        print(f"Unexpected error: {type(e).__name__}: {e}")
+        raise
 
-async def test_mcp_client_manager():
-    """Test the updated MCPClientManager"""
+async def check_mcp_client_manager(manager):
+    """Test the updated MCPClientManager; the caller owns manager and cleans it up"""
     print("\n=== Testing MCPClientManager ===")
     
-    manager = MCPClientManager()
-    
     try:
         # Test adding clients for multiple agents
         agents = ["Kairos", "Mercurius", "calendar_concierge_discord"]
         
-        for agent_name in agents:
-            print(f"\nAdding client for agent '{agent_name}'...")
-            success = await manager.add_client(agent_name)
-            print(f"Result: {'Success' if success else 'Failed'}")
+        # Connect all agents concurrently; one agent's failure must not cancel the others
+        print(f"\nAdding clients for agents: {', '.join(agents)}...")
+        results = await asyncio.gather(
+            *(asyncio.wait_for(manager.add_client(agent_name), timeout=ADD_CLIENT_TIMEOUT) for agent_name in agents),
+            return_exceptions=True,
+        )
+        for agent_name, success in zip(agents, results):
+            if isinstance(success, asyncio.TimeoutError):
+                print(f"Agent '{agent_name}': Failed (timeout after {ADD_CLIENT_TIMEOUT:.0f}s)")
+            elif isinstance(success, BaseException):
+                print(f"Agent '{agent_name}': Failed ({success})")
+            else:
+                print(f"Agent '{agent_name}': {'Success' if success else 'Failed'}")
         
         # Show status summary
-        print("\n=== MCP Client Manager Status Summary ===")
+        lines = ["", "=== MCP Client Manager Status Summary ==="]
         summary = manager.get_status_summary()
         
         for agent_name, info in summary.items():
-            print(f"\nAgent: {agent_name}")
-            print(f"  Servers: {info['connected_servers']}/{info['total_servers']} connected")
-            print(f"  Tools: {info['total_tools']} available")
-            print(f"  Tool names: {', '.join(info['tool_names'][:5])}{'...' if len(info['tool_names']) > 5 else ''}")
+            lines.append(f"\nAgent: {agent_name}")
+            lines.append(f"  Servers: {info['connected_servers']}/{info['total_servers']} connected")
+            lines.append(f"  Tools: {info['total_tools']} available")
+            tool_names = info['tool_names']
+            suffix = '...' if len(tool_names) > 5 else ''
+            lines.append(f"  Tool names: {', '.join(tool_names[:5])}{suffix}")
             
             for server_path, connected in info['server_status'].items():
                 status_icon = "✓" if connected else "✗"
-                print(f"    {status_icon} {server_path}")
+                lines.append(f"    {status_icon} {server_path}")
+        emit(lines)
         
-        return True
+        return PhaseResult.OK
         
+    except EXPECTED_ERRORS as e:
+        result = classify_error(e)
+        print(f"Error ({result.value}): {type(e).__name__}: {e}")
+        return result
     except Exception as e:
-        print(f"Error: {str(e)}")
-        return False
-    finally:
-        await manager.cleanup_all()
+        print(f"Unexpected error: {type(e).__name__}: {e}")
+        raise
 
-async def benchmark_connection_speed():
-    """Benchmark connection speed: sequential vs concurrent"""
+async def benchmark_connection_speed(agent_name: str, status, concurrent_ns: int):
+    """Benchmark connection speed: sequential vs concurrent
+    
+    The concurrent figures come from the shared client main() already
+    connected. The sweep then reconnects fresh clients at each fan-out in
+    BENCH_CONCURRENCY, up to twice the server count, so the operator can
+    pick the knee for this agent's servers.
+    """
     print("\n=== Connection Speed Benchmark ===")
     
-    agent_name = "Kairos"  # Use agent with multiple servers
+    # Opens real connections and reports timings: only when explicitly asked for
+    if os.environ.get("RAS_RUN_BENCH") != "1":
+        print("(skipping benchmark; set RAS_RUN_BENCH=1)")
+        return None
     
-    # Test concurrent connections (new architecture)
-    print("Testing concurrent connections...")
-    client = MultiServerMCPClient(agent_name)
+    async def _run(concurrency: int):
+        """Connect a fresh client with the given fan-out; return (elapsed ns, status)."""
+        from mcp_clients.mcp_python_sdk_2025_03_26.multi_server_client import MultiServerMCPClient
+        
+        client = MultiServerMCPClient(agent_name)
+        try:
+            start_ns = time.perf_counter_ns()
+            status = await client.connect_to_servers(concurrent_connections=concurrency, timeout=10.0)
+            return time.perf_counter_ns() - start_ns, status
+        finally:
+            await client.cleanup()
     
-    start_time = asyncio.get_event_loop().time()
-    status = await client.connect_to_servers(concurrent_connections=5, timeout=10.0)
-    concurrent_time = asyncio.get_event_loop().time() - start_time
+    # Baseline: one server at a time
+    print("Testing sequential connections...")
+    sequential_ns, sequential_status = await _run(1)
+    successful_connections = sum(1 for connected in sequential_status.values() if connected)
+    print(f"Sequential: {successful_connections} servers connected in {sequential_ns / 1e6:.1f} ms")
+    bench_metrics = {"sequential_s": sequential_ns / 1e9, "sequential_n": successful_connections}
     
+    # All servers at once (new architecture), measured when main() connected
     successful_connections = sum(1 for connected in status.values() if connected)
-    print(f"Concurrent: {successful_connections} servers connected in {concurrent_time:.2f}s")
+    print(f"Concurrent: {successful_connections} servers connected in {concurrent_ns / 1e6:.1f} ms")
+    bench_metrics.update(concurrent_s=concurrent_ns / 1e9, n=successful_connections)
+    
+    if concurrent_ns > 0:
+        print(f"Speedup: {sequential_ns / concurrent_ns:.2f}x")
+    
+    # Sweep the fan-out; the sequential run above is the concurrency=1 point
+    n_servers = len(status)
+    sweep = {1: sequential_ns}
+    for concurrency in BENCH_CONCURRENCY:
+        if concurrency not in sweep and concurrency <= n_servers * 2:
+            sweep[concurrency], _ = await _run(concurrency)
     
-    await client.cleanup()
+    print(f"\nConcurrency sweep ({n_servers} servers), fastest first:")
+    print(f"  {'concurrency':>11}  {'ms':>9}")
+    for concurrency, elapsed_ns in sorted(sweep.items(), key=lambda item: item[1]):
+        print(f"  {concurrency:>11}  {elapsed_ns / 1e6:>9.1f}")
+    bench_metrics["sweep_s"] = {concurrency: elapsed_ns / 1e9 for concurrency, elapsed_ns in sweep.items()}
     
     print(f"\nConcurrent connection approach:")
     print(f"  ✓ No blocking - all servers connect in parallel")
     print(f"  ✓ Error isolation - failed servers don't block others")
     print(f"  ✓ Timeout control - configurable per-server timeouts")
     print(f"  ✓ Better tool routing - each client knows its tools")
+    
+    return bench_metrics
 
 async def main():
     """Main test function"""
     print("Testing One-Client-Per-Server MCP Architecture")
     print("=" * 50)
     
+    from ras.agent_config_buffer import get_agent_servers, load_agent_manifest
+    from mcp_clients.mcp_python_sdk_2025_03_26.multi_server_client import MultiServerMCPClient
+    from ras.mcp_client_manager import MCPClientManager
+    
     # Load agent configuration
     try:
         print("Loading agent manifest...")
         load_agent_manifest("config/example_agent_manifest.json")
         print("✓ Agent manifest loaded successfully")
+        
+        # Warm the per-agent server lists so the phases below hit the cache
+        for agent_name in ("Kairos", "Mercurius", "calendar_concierge_discord"):
+            get_agent_servers(agent_name)
     except Exception as e:
         print(f"✗ Failed to load agent manifest: {str(e)}")
         print("Make sure you're running from the project root directory")
         return
     
-    # Test MultiServerMCPClient
-    success = await test_multi_server_client("Kairos")
-    if not success:
-        print("MultiServerMCPClient test failed")
-        return
-    
-    # Test MCPClientManager
-    success = await test_mcp_client_manager()
-    if not success:
-        print("MCPClientManager test failed")
+    # One Kairos client (an agent with multiple servers) shared by the client test and the benchmark
+    agent_name = "Kairos"
+    client = MultiServerMCPClient(agent_name)
+    manager = MCPClientManager()
+    # Machine-readable results, printed as one "METRICS {json}" line for regression tracking
+    metrics = {"agent": agent_name, "phases": {}}
+    try:
+        status, connect_ns = await asyncio.wait_for(connect_client(agent_name, client), timeout=PHASE_TIMEOUT)
+        n_servers = len(status)
+        metrics["phases"]["connect"] = {
+            "concurrent_connect_s": connect_ns / 1e9,
+            "n_servers": n_servers,
+            "n_connected": sum(1 for connected in status.values() if connected),
+            "per_server_s": connect_ns / 1e9 / n_servers if n_servers else None,
+        }
+        
+        # Test MultiServerMCPClient and MCPClientManager; they are independent, so run them together
+        client_result, manager_result = await run_concurrently(
+            bounded(check_multi_server_client(agent_name, client, status), "MultiServerMCPClient test"),
+            bounded(check_mcp_client_manager(manager), "MCPClientManager test"),
+        )
+        metrics["phases"]["client"] = {"result": client_result.value}
+        metrics["phases"]["manager"] = {"result": manager_result.value}
+        if client_result is not PhaseResult.OK:
+            print(f"MultiServerMCPClient test failed ({client_result.value})")
+            return
+        if manager_result is not PhaseResult.OK:
+            print(f"MCPClientManager test failed ({manager_result.value})")
+            return
+        
+        metrics["n_tools"] = len(client.get_all_tools())
+        
+        # Benchmark connection speed, alone so concurrent load doesn't skew its timings
+        # Each sweep point reconnects every server, so the phase gets a ceiling per point
+        bench_metrics = await asyncio.wait_for(
+            benchmark_connection_speed(agent_name, status, connect_ns),
+            timeout=PHASE_TIMEOUT * len(BENCH_CONCURRENCY),
+        )
+        if bench_metrics is not None:
+            metrics["phases"]["bench"] = bench_metrics
+    except asyncio.TimeoutError:
+        print(f"✗ Test phase timed out after {PHASE_TIMEOUT:.0f}s")
+        metrics["timeout"] = True
         return
-    
-    # Benchmark connection speed
-    await benchmark_connection_speed()
+    finally:
+        # Independent teardowns (subprocess/socket closes), so overlap them
+        await close_all(client.cleanup(), manager.cleanup_all())
+        print("METRICS " + json.dumps(metrics))
     
     print("\n" + "=" * 50)
     print("✓ All tests completed successfully!")
@@ -155,5 +341,25 @@ async def main():
     print("  ✓ Better resource management per server")
     print("  ✓ Configurable timeouts and retry logic")
 
+# pytest entry points: plain functions that drive the session event loop from
+# conftest.py, so the Kairos client connects once for all of them.
+
+def test_tools_listed(kairos_client):
+    """The shared Kairos client reports its tools"""
+    tools = as_tool_infos(kairos_client.get_all_tools())
+    assert tools, "Kairos connected but reported no tools"
+    assert all(tool.name for tool in tools)
+
+def test_routing(kairos_client):
+    """Every tool the shared Kairos client reports routes to a server"""
+    unrouted = [tool.name for tool in as_tool_infos(kairos_client.get_all_tools())
+                if kairos_client.find_client_for_tool(tool.name) is None]
+    assert not unrouted, f"Tools with no server: {unrouted}"
+
+def test_mcp_client_manager(session_loop, client_manager):
+    """MCPClientManager connects the example agents and reports their status"""
+    result = session_loop.run_until_complete(bounded(check_mcp_client_manager(client_manager), "MCPClientManager test"))
+    assert result is PhaseResult.OK
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for running a response's MCP commands in tools_and_data.mcp_command_helper
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+
+# Add src to path
+SRC_DIR = Path(__file__).resolve().parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from ras.agent_config_buffer import set_tools_and_data_mcp_commands_config
+from tools_and_data import mcp_command_helper
+
+# Handlers record how many pooled handlers were running when the unsafe one ran
+HANDLER_SOURCE = textwrap.dedent('''
+    import threading
+    import time
+
+    _lock = threading.Lock()
+    active = 0
+    seen_by_unsafe = []
+
+    def pooled(command_parameters, internal_params):
+        global active
+        with _lock:
+            active += 1
+        try:
+            time.sleep(0.05)
+        finally:
+            with _lock:
+                active -= 1
+        return "pooled"
+
+    def unsafe(command_parameters, internal_params):
+        with _lock:
+            seen_by_unsafe.append(active)
+        return "unsafe"
+''')
+
+def test_thread_unsafe_command_never_overlaps_pooled_commands(tmp_path):
+    """A thread_safe=False command runs only once no pooled command is running"""
+    module_path = tmp_path / "thread_safety_handlers.py"
+    module_path.write_text(HANDLER_SOURCE)
+
+    def command(system_text, handler_function, **extra):
+        return {"system_text": system_text, "enabled": True, "python_code_module": str(module_path),
+                "handler_function": handler_function, **extra}
+
+    agent_name = "thread_safety_test_agent"
+    set_tools_and_data_mcp_commands_config(agent_name, {"mcp_commands": [
+        command("/first", "pooled"),
+        command("/unsafe", "unsafe", thread_safe=False),
+        command("/second", "pooled"),
+        command("/third", "pooled"),
+    ]})
+
+    commands = ("/first", "/unsafe", "/second", "/third")
+    results = mcp_command_helper._run_commands(agent_name, commands, "/first")
+
+    assert results == ["pooled", "unsafe", "pooled", "pooled"]
+    handlers = sys.modules[f"{mcp_command_helper._MODULE_NAMESPACE}.thread_safety_handlers"]
+    assert handlers.seen_by_unsafe == [0]